@@ -1,17 +1,31 @@
-from flask import Flask, render_template_string, redirect, url_for, request, flash, jsonify, send_from_directory
+from flask import Flask, render_template_string, redirect, url_for, request, flash, jsonify, send_from_directory, make_response, abort
 from flask_sqlalchemy import SQLAlchemy
+from flask_caching import Cache
+from sqlalchemy import func, case, select, tuple_, update
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, lazyload, load_only, raiseload
+from sqlalchemy.types import TypeDecorator
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import os
 import re
 import json
 import uuid
+import base64
+import hashlib
+import shutil
+import gzip
+import sqlite3
+from markupsafe import Markup
+from jinja2 import FileSystemBytecodeCache
+from jinja2.utils import htmlsafe_json_dumps
 from werkzeug.utils import secure_filename
-
-from flask import Flask, jsonify, request, make_response
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from werkzeug.security import generate_password_hash, check_password_hash
+from PIL import Image
 from flask_cors import CORS
 
 app = Flask(__name__)
@@ -142,50 +156,197 @@ def get_meetings(meeting_type):
 # Create Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'kesgrave-cms-secret-key-2025'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///kesgrave_working.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('CMS_DATABASE_URI', 'sqlite:///kesgrave_working.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Buffer size when copying uploads to disk
+UPLOAD_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # Uploaded filenames are unique, so browsers can cache them for 30 days
+THUMBNAIL_SIZE = (200, 200)  # Bounding box for list/avatar thumbnails
+# The cache lives on disk so every worker process on the host shares it - a
+# delete_memoized() after a write then clears the entry for all of them
+app.config['CACHE_TYPE'] = 'FileSystemCache'
+app.config['CACHE_DIR'] = os.environ.get('CMS_CACHE_DIR', os.path.join(app.instance_path, 'cache'))
+app.config['CACHE_DEFAULT_TIMEOUT'] = 60
+
+# Static files are either content-hashed build assets or versioned with a
+# ?v= query string (see admin_css_url), so browsers may keep them for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 365 * 24 * 60 * 60
+
+@app.after_request
+def mark_static_immutable(response):
+    """Let browsers skip revalidating versioned static files until they expire"""
+    if request.endpoint == 'static' and response.status_code == 200:
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    return response
+
+# Gzip HTML and JSON responses larger than this for clients that accept it
+COMPRESS_MIN_SIZE = 500
+COMPRESS_MIMETYPES = frozenset({'text/html', 'application/json'})
+# A gzipped body is a different representation, so it gets its own ETag
+GZIP_ETAG_SUFFIX = '-gzip'
+
+@app.after_request
+def compress_response(response):
+    """Gzip rendered pages - the admin HTML is large and very repetitive"""
+    # Whether or not this particular response is compressed, the same URL may
+    # be for another client, so shared caches must key on Accept-Encoding
+    if response.mimetype in COMPRESS_MIMETYPES:
+        response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES
+            or 'gzip' not in request.accept_encodings):
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(etag + GZIP_ETAG_SUFFIX, weak)
+    return response
 
 # Create upload directories
 upload_dirs = ['councillors', 'content/images', 'content/downloads', 'events', 'meetings', 'homepage/logo', 'homepage/slides']
 for upload_dir in upload_dirs:
     os.makedirs(os.path.join(app.config['UPLOAD_FOLDER'], upload_dir), exist_ok=True)
 
-# Initialize extensions
-db = SQLAlchemy(app)
+# Tune every SQLite connection: WAL lets readers run alongside a writer, and
+# synchronous=NORMAL is safe under WAL while avoiding an fsync per commit.
+@sa_event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA cache_size=-20000')
+        cursor.close()
+
+# Set CMS_RAISELOAD=1 while developing to make a lazy relationship load in the
+# list views raise an error instead of quietly issuing one query per row
+RAISELOAD_IN_LISTS = os.environ.get('CMS_RAISELOAD') == '1'
+
+def list_view_options(*options):
+    """Loader options for a list view query, plus raiseload('*') when RAISELOAD_IN_LISTS is on"""
+    if RAISELOAD_IN_LISTS:
+        return options + (raiseload('*'),)
+    return options
+
+# Initialize extensions - objects keep their loaded state after a commit instead
+# of re-querying the database on the next attribute access
+db = SQLAlchemy(app, session_options={'expire_on_commit': False})
+cache = Cache(app)
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
 
-# User class for authentication
-class AdminUser(UserMixin):
-    def __init__(self, id, username='admin'):
-        self.id = id
-        self.username = username
+# Admin accounts - passwords are stored as salted Werkzeug hashes, never in plain text
+class AdminUser(UserMixin, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), nullable=False, unique=True)
+    password_hash = db.Column(db.String(255), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def set_password(self, password):
+        self.password_hash = generate_password_hash(password)
+    
+    def check_password(self, password):
+        return check_password_hash(self.password_hash, password)
 
 @login_manager.user_loader
 def load_user(user_id):
-    return AdminUser(user_id)
+    # A primary key lookup - one indexed read per authenticated request
+    return db.session.get(AdminUser, int(user_id))
+
+def init_admin_user():
+    """Create the initial admin account if there are no accounts yet"""
+    with app.app_context():
+        if AdminUser.query.count() == 0:
+            admin = AdminUser(username='admin')
+            admin.set_password(os.environ.get('CMS_ADMIN_PASSWORD', 'admin'))
+            db.session.add(admin)
+            db.session.commit()
 
 # Helper function to format dates in UK format
+# (plain integer formatting - these run once per table row, and strftime
+# re-parses its format string on every call)
+@lru_cache(maxsize=4096)
+def _uk_day(year, month, day):
+    """DD/MM/YYYY for one calendar day - rows saved on the same day share the string"""
+    return f"{day:02d}/{month:02d}/{year}"
+
 def format_uk_date(date_obj):
     """Format datetime object to UK format DD/MM/YYYY"""
     if isinstance(date_obj, datetime):
-        return date_obj.strftime('%d/%m/%Y')
+        return _uk_day(date_obj.year, date_obj.month, date_obj.day)
     return date_obj
 
 def format_uk_datetime(date_obj):
     """Format datetime object to UK format DD/MM/YYYY HH:MM"""
     if isinstance(date_obj, datetime):
-        return date_obj.strftime('%d/%m/%Y %H:%M')
+        return f"{date_obj.day:02d}/{date_obj.month:02d}/{date_obj.year} {date_obj.hour:02d}:{date_obj.minute:02d}"
     return date_obj
 
+def parse_form_date(value):
+    """datetime for a YYYY-MM-DD date input, or None if it is empty or invalid"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
 # Add template filters
 app.jinja_env.filters['uk_date'] = format_uk_date
 app.jinja_env.filters['uk_datetime'] = format_uk_datetime
 
+# Compiled inline templates, keyed by their source string
+_compiled_templates = {}
+
+# Persist compiled template bytecode across restarts and between workers
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+def _compile_inline_template(source):
+    """Compile an inline template, reusing bytecode from the cache when the source is unchanged"""
+    env = app.jinja_env
+    # Inline templates have no name or file, so key the cached bytecode on the
+    # source itself; they are still compiled nameless, like from_string, so
+    # autoescaping stays on
+    cache_key = f"inline-{hashlib.sha1(source.encode('utf-8')).hexdigest()}"
+    bucket = env.bytecode_cache.get_bucket(env, cache_key, None, source)
+    if bucket.code is None:
+        bucket.code = env.compile(source)
+        env.bytecode_cache.set_bucket(bucket)
+    return env.template_class.from_code(env, bucket.code, env.make_globals(None))
+
+def get_compiled_template(source):
+    """Compile an inline template source string once per process"""
+    template = _compiled_templates.get(source)
+    if template is None:
+        template = _compiled_templates[source] = _compile_inline_template(source)
+    return template
+
+def render_cached_template(source, **context):
+    """
+    Render an inline template like render_template_string, but compile each
+    source string only once per process instead of on every request
+    """
+    template = get_compiled_template(source)
+    app.update_template_context(context)
+    return template.render(context)
+
+# Shared admin stylesheet (sidebar and layout), linked with a content hash so a
+# changed file gets a new URL while unchanged pages reuse the browser's copy
+with open(os.path.join(app.static_folder, 'css', 'admin.css'), 'rb') as admin_css_file:
+    app.jinja_env.globals['admin_css_url'] = f"/static/css/admin.css?v={hashlib.md5(admin_css_file.read()).hexdigest()[:12]}"
+
 # Standardized sidebar template for consistent navigation across all CMS pages
+@lru_cache(maxsize=None)
 def get_sidebar_html(active_page=''):
     """
     Generate standardized sidebar HTML for all CMS pages
@@ -232,41 +393,21 @@ def get_sidebar_html(active_page=''):
         </nav>
     '''
 
-# Standardized CSS for sidebar styling
-def get_sidebar_css():
-    """
-    Generate standardized CSS for sidebar styling
-    """
-    return '''
-        .sidebar {
-            position: fixed;
-            top: 0;
-            left: 0;
-            height: 100vh;
-            width: 260px;
-            background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-            color: white;
-            z-index: 1000;
-            overflow-y: auto;
-        }
-        .main-content {
-            margin-left: 260px;
-            padding: 2rem;
-            background-color: #f8f9fa;
-            min-height: 100vh;
-        }
-        .nav-link {
-            color: rgba(255,255,255,0.8);
-            padding: 0.75rem 1.5rem;
-            display: block;
-            text-decoration: none;
-            transition: all 0.3s ease;
-        }
-        .nav-link:hover, .nav-link.active {
-            color: white;
-            background: rgba(255,255,255,0.1);
-        }
-    '''
+# JSON stored in a TEXT column, decoded once per row load instead of on every access
+class JSONText(TypeDecorator):
+    impl = db.Text
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        return json.dumps(value) if value else None
+    
+    def process_result_value(self, value, dialect):
+        if not value:
+            return None
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
 
 # Database Models
 class Tag(db.Model):
@@ -276,11 +417,18 @@ class Tag(db.Model):
     description = db.Column(db.String(200))
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Serves the active tag list (WHERE is_active ORDER BY name) straight from the index
+    __table_args__ = (db.Index('ix_tag_active_name', 'is_active', 'name'),)
 
-class CouncillorTag(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    councillor_id = db.Column(db.Integer, db.ForeignKey('councillor.id'), nullable=False)
-    tag_id = db.Column(db.Integer, db.ForeignKey('tag.id'), nullable=False)
+# Councillor <-> tag association table; the composite primary key also stops a
+# tag being assigned to the same councillor twice and serves lookups by
+# councillor, while tag_id gets its own index for lookups and deletes by tag
+councillor_tag = db.Table(
+    'councillor_tag',
+    db.Column('councillor_id', db.Integer, db.ForeignKey('councillor.id'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tag.id'), primary_key=True, index=True)
+)
 
 class Councillor(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -293,13 +441,16 @@ class Councillor(db.Model):
     phone = db.Column(db.String(20))
     qualifications = db.Column(db.Text)  # Qualifications/credentials
     image_filename = db.Column(db.String(255))
-    social_links = db.Column(db.Text)  # JSON string for social media links
+    social_links = db.Column(JSONText)  # Social media links as {platform: url}
     is_published = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    
+    # Published councillors ordered by last update can be read straight from this index
+    __table_args__ = (db.Index('ix_councillor_pub_updated', 'is_published', 'updated_at'),)
     
     # Relationship to tags through association table
-    tags = db.relationship('Tag', secondary='councillor_tag', backref='councillors')
+    tags = db.relationship('Tag', secondary=councillor_tag, backref='councillors', lazy='selectin')
 
 # Content models for Phase 2
 class ContentCategory(db.Model):
@@ -330,9 +481,9 @@ class ContentPage(db.Model):
     slug = db.Column(db.String(200), unique=True)
     short_description = db.Column(db.Text)  # Short description
     long_description = db.Column(db.Text)   # Long description (rich text)
-    category_id = db.Column(db.Integer, db.ForeignKey('content_category.id'))
+    category_id = db.Column(db.Integer, db.ForeignKey('content_category.id'), index=True)
     subcategory_id = db.Column(db.Integer, db.ForeignKey('content_subcategory.id'))
-    status = db.Column(db.String(20), default='Draft')  # Draft, Published, Archived
+    status = db.Column(db.String(20), default='Draft', index=True)  # Draft, Published, Archived
     is_featured = db.Column(db.Boolean, default=False)
     
     # Content dates
@@ -341,11 +492,16 @@ class ContentPage(db.Model):
     last_reviewed = db.Column(db.DateTime)
     next_review_date = db.Column(db.DateTime)
     
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Never NULL - the content list pages through (created_at, id), and a NULL
+    # would drop the row out of every cursor comparison
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     category = db.relationship('ContentCategory', backref='pages')
     subcategory = db.relationship('ContentSubcategory', backref='pages')
+    
+    # Keyset pagination on the pages list walks (created_at, id) in either direction
+    __table_args__ = (db.Index('ix_content_page_created_id', 'created_at', 'id'),)
 
 # Content Gallery Model for multiple images with metadata
 class ContentGallery(db.Model):
@@ -403,7 +559,7 @@ class Event(db.Model):
     category_id = db.Column(db.Integer, db.ForeignKey('event_category.id'))
     
     # Date and time
-    start_date = db.Column(db.DateTime, nullable=False)
+    start_date = db.Column(db.DateTime, nullable=False, index=True)
     end_date = db.Column(db.DateTime)
     all_day = db.Column(db.Boolean, default=False)
     
@@ -429,7 +585,7 @@ class Event(db.Model):
     featured = db.Column(db.Boolean, default=False)
     
     # Status
-    status = db.Column(db.String(20), default='Draft')  # Draft, Published, Cancelled
+    status = db.Column(db.String(20), default='Draft', index=True)  # Draft, Published, Cancelled
     is_published = db.Column(db.Boolean, default=False)
     
     # Metadata
@@ -500,7 +656,7 @@ class Meeting(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     meeting_type_id = db.Column(db.Integer, db.ForeignKey('meeting_type.id'), nullable=False)
-    meeting_date = db.Column(db.Date, nullable=False)
+    meeting_date = db.Column(db.Date, nullable=False, index=True)
     meeting_time = db.Column(db.Time, nullable=False)
     location = db.Column(db.String(200))
     
@@ -600,29 +756,161 @@ class HomepageQuicklink(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-# Helper functions for social links
-def get_social_links(councillor):
-    """Get social links as dictionary"""
-    if councillor.social_links:
-        try:
-            return json.loads(councillor.social_links)
-        except:
-            return {}
-    return {}
+# Font Awesome icon for each supported social platform
+SOCIAL_ICON_MAP = {
+    'twitter': 'fab fa-twitter',
+    'linkedin': 'fab fa-linkedin',
+    'facebook': 'fab fa-facebook',
+    'instagram': 'fab fa-instagram'
+}
+
+# Social link inputs on the councillor forms: (platform, icon, placeholder)
+SOCIAL_PLATFORMS = [
+    (platform, SOCIAL_ICON_MAP[platform], placeholder)
+    for platform, placeholder in (
+        ('twitter', 'Twitter/X URL'),
+        ('linkedin', 'LinkedIn URL'),
+        ('facebook', 'Facebook URL'),
+        ('instagram', 'Instagram URL')
+    )
+]
+
+@lru_cache(maxsize=1024)
+def _social_icons_markup(links):
+    return Markup('').join(
+        Markup('<a href="{}" target="_blank" class="text-primary me-1"><i class="{}"></i></a>').format(
+            url, SOCIAL_ICON_MAP.get(platform, 'fas fa-link')
+        )
+        for platform, url in links if url and url.lower().startswith(('http://', 'https://'))
+    )
+
+def social_icons_html(social_links):
+    """Render a councillor's social links as escaped icon anchors"""
+    if not social_links:
+        return Markup('')
+    # Memoised on the (platform, url) pairs, so each distinct set is built once
+    return _social_icons_markup(tuple(social_links.items()))
+
+app.jinja_env.filters['social_icons'] = social_icons_html
+
+# Cached dashboard data - invalidated whenever councillors or tags change
+@cache.memoize(timeout=60)
+def get_dashboard_stats():
+    """Get councillor and tag counts for the dashboard"""
+    total_councillors, published_councillors = db.session.query(
+        func.count(Councillor.id),
+        func.coalesce(func.sum(case((Councillor.is_published == True, 1), else_=0)), 0)
+    ).one()
+    total_tags, active_tags = db.session.query(
+        func.count(Tag.id),
+        func.coalesce(func.sum(case((Tag.is_active == True, 1), else_=0)), 0)
+    ).one()
+    return {
+        'total_councillors': total_councillors,
+        'published_councillors': published_councillors,
+        'total_tags': total_tags,
+        'active_tags': active_tags
+    }
+
+@cache.memoize(timeout=60)
+def get_recent_councillors():
+    """Get the five most recently updated councillors as plain dictionaries"""
+    rows = db.session.query(Councillor.name, Councillor.title, Councillor.is_published).order_by(
+        Councillor.updated_at.desc()
+    ).limit(5).all()
+    return [{'name': name, 'title': title, 'is_published': is_published} for name, title, is_published in rows]
+
+@cache.memoize(timeout=300)
+def get_tag_lookup():
+    """Get {tag id: (name, color)} for every tag - tags are few and rarely change"""
+    return {tag_id: (name, color) for tag_id, name, color in db.session.execute(select(Tag.id, Tag.name, Tag.color))}
+
+@cache.memoize(timeout=300)
+def get_active_tags():
+    """Get the active tags, ordered by name, as plain dictionaries for the councillor forms"""
+    rows = db.session.execute(
+        select(Tag.id, Tag.name, Tag.color).where(Tag.is_active == True).order_by(Tag.name)
+    )
+    return [{'id': tag_id, 'name': name, 'color': color} for tag_id, name, color in rows]
 
-def set_social_links(councillor, links_dict):
-    """Set social links from dictionary"""
-    councillor.social_links = json.dumps(links_dict) if links_dict else None
+@cache.memoize(timeout=300)
+def get_active_categories():
+    """Get the active content categories, each with its subcategories, as plain dictionaries for filter and form dropdowns"""
+    rows = db.session.execute(
+        select(ContentCategory.id, ContentCategory.name, ContentCategory.color).where(ContentCategory.is_active == True)
+    )
+    categories = [
+        {'id': category_id, 'name': name, 'color': color, 'subcategories': []}
+        for category_id, name, color in rows
+    ]
+    categories_by_id = {category['id']: category for category in categories}
+    subcategory_rows = db.session.execute(
+        select(ContentSubcategory.id, ContentSubcategory.name, ContentSubcategory.category_id)
+        .where(ContentSubcategory.category_id.in_(list(categories_by_id)))
+        .order_by(ContentSubcategory.id)
+    )
+    for subcategory_id, name, category_id in subcategory_rows:
+        categories_by_id[category_id]['subcategories'].append({'id': subcategory_id, 'name': name})
+    return categories
+
+@cache.memoize(timeout=300)
+def get_subcategories_json():
+    """The active categories' subcategories as one script-safe JSON object keyed by category id, for the page form dropdowns"""
+    return htmlsafe_json_dumps({category['id']: category['subcategories'] for category in get_active_categories()})
+
+def get_category_version():
+    """Token that changes whenever a content category is saved, added or deleted, or a subcategory is added or removed"""
+    # Read from the tables rather than kept in the cache, so every worker derives
+    # the same value - categories have no updated_at, but there are only a handful.
+    # Subcategories are only ever added or deleted, so their count and highest id
+    # (carried on each row) are enough to notice a change
+    rows = db.session.execute(
+        select(
+            ContentCategory.id, ContentCategory.name, ContentCategory.description, ContentCategory.color,
+            ContentCategory.url_path, ContentCategory.is_active, ContentCategory.is_predefined,
+            select(func.count(ContentSubcategory.id)).scalar_subquery(),
+            select(func.max(ContentSubcategory.id)).scalar_subquery()
+        ).order_by(ContentCategory.id)
+    ).all()
+    return hashlib.md5(repr([tuple(row) for row in rows]).encode()).hexdigest()
+
+def invalidate_category_cache():
+    """Drop the cached active category list and its dropdown JSON after a category change"""
+    cache.delete_memoized(get_active_categories)
+    cache.delete_memoized(get_subcategories_json)
+
+def get_councillor_tag_ids():
+    """Get {councillor id: [tag ids]} straight from the association table"""
+    tag_ids = {}
+    for councillor_id, tag_id in db.session.execute(select(councillor_tag.c.councillor_id, councillor_tag.c.tag_id)):
+        tag_ids.setdefault(councillor_id, []).append(tag_id)
+    return tag_ids
+
+def invalidate_tag_cache():
+    """Drop the cached tag lookup and active tag list after a tag change"""
+    cache.delete_memoized(get_tag_lookup)
+    cache.delete_memoized(get_active_tags)
+
+def invalidate_dashboard_cache():
+    """Drop cached dashboard data and the rendered tags page after a councillor or tag change"""
+    cache.delete_memoized(get_dashboard_stats)
+    cache.delete_memoized(get_recent_councillors)
+    cache.delete_memoized(render_tags_page)
 
 # File upload helper
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp'})
+ALLOWED_DOWNLOAD_EXTENSIONS = frozenset({
+    'pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'txt', 'csv',
+    'zip', 'rar', 'png', 'jpg', 'jpeg', 'gif', 'webp'
+})
+
 def allowed_image_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in ALLOWED_IMAGE_EXTENSIONS
 
 def allowed_download_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in {
-        'pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'txt', 'csv', 
-        'zip', 'rar', 'png', 'jpg', 'jpeg', 'gif', 'webp'
-    }
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in ALLOWED_DOWNLOAD_EXTENSIONS
 
 def allowed_file(filename):
     """Legacy function for backward compatibility"""
@@ -633,16 +921,55 @@ def save_uploaded_file(file, subfolder, file_type='image'):
     allowed_func = allowed_image_file if file_type == 'image' else allowed_download_file
     
     if file and allowed_func(file.filename):
-        filename = secure_filename(file.filename)
-        # Add timestamp to avoid conflicts
-        name, ext = os.path.splitext(filename)
-        filename = f"{name}_{int(datetime.now().timestamp())}{ext}"
+        # Add a random suffix to avoid conflicts, even between uploads in the same second
+        name, ext = os.path.splitext(secure_filename(file.filename))
+        filename = f"{name}_{uuid.uuid4().hex[:12]}{ext}"
         
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], subfolder, filename)
-        file.save(filepath)
+        # Copy straight from the upload stream in 1 MiB chunks
+        with open(filepath, 'wb') as destination:
+            shutil.copyfileobj(file.stream, destination, UPLOAD_CHUNK_SIZE)
+        
+        if file_type == 'image':
+            create_thumbnail(filepath)
         return filename
     return None
 
+# Threads for saving a batch of uploads side by side - the disk copy and
+# Pillow's thumbnail resize both release the GIL
+_upload_pool = ThreadPoolExecutor(max_workers=4)
+
+def save_uploaded_files(files, subfolder, file_type='image'):
+    """Save several uploaded files in parallel and return their filenames in order (None for skipped files)"""
+    futures = [
+        _upload_pool.submit(save_uploaded_file, file, subfolder, file_type) if file and file.filename else None
+        for file in files
+    ]
+    return [future.result() if future else None for future in futures]
+
+def get_thumbnail_filename(filename):
+    """Get the filename of the WebP thumbnail stored next to an uploaded image"""
+    return f"{os.path.splitext(filename)[0]}_thumb.webp"
+
+def create_thumbnail(filepath):
+    """Write a small WebP thumbnail next to an uploaded image for use in lists"""
+    try:
+        with Image.open(filepath) as image:
+            image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+            image.thumbnail(THUMBNAIL_SIZE, Image.LANCZOS)
+            image.save(get_thumbnail_filename(filepath), 'WEBP', quality=80)
+    except Exception as e:
+        print(f"Error creating thumbnail for {filepath}: {e}")
+
+def thumbnail_url(filename, subfolder):
+    """URL of an upload's thumbnail, falling back to the original for older uploads"""
+    thumbnail = get_thumbnail_filename(filename)
+    if os.path.exists(os.path.join(app.config['UPLOAD_FOLDER'], subfolder, thumbnail)):
+        return f"/uploads/{subfolder}/{thumbnail}"
+    return f"/uploads/{subfolder}/{filename}"
+
+app.jinja_env.filters['thumbnail_url'] = thumbnail_url
+
 # Routes
 @app.route('/')
 def index():
@@ -651,20 +978,25 @@ def index():
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
-        # Simple authentication - any username/password works
-        user = AdminUser(1)
-        login_user(user)
-        next_page = request.args.get('next')
-        return redirect(next_page) if next_page else redirect(url_for('dashboard'))
-    
-    return render_template_string('''
+        user = AdminUser.query.filter_by(username=request.form.get('username', '').strip()).first()
+        if user and user.check_password(request.form.get('password', '')):
+            login_user(user)
+            next_page = request.args.get('next')
+            return redirect(next_page) if next_page else redirect(url_for('dashboard'))
+        flash('Invalid username or password', 'error')
+    
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Login - Kesgrave CMS</title>
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
+        <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+        <link rel="preload" href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" as="style" crossorigin="anonymous">
+        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet" crossorigin="anonymous">
+        <link rel="prefetch" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" as="style" crossorigin="anonymous">
         <style>
             body {
                 background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -696,6 +1028,11 @@ def login():
                 <p class="mb-0">Content Management System</p>
             </div>
             <div class="p-4">
+                {% with messages = get_flashed_messages(with_categories=true) %}
+                    {% for category, message in messages %}
+                        <div class="alert alert-{{ 'danger' if category == 'error' else 'success' }}">{{ message }}</div>
+                    {% endfor %}
+                {% endwith %}
                 <form method="POST">
                     <div class="mb-3">
                         <label class="form-label">Username</label>
@@ -723,25 +1060,30 @@ def logout():
 @login_required
 def dashboard():
     # Get statistics
-    total_councillors = Councillor.query.count()
-    published_councillors = Councillor.query.filter_by(is_published=True).count()
-    total_tags = Tag.query.count()
-    active_tags = Tag.query.filter_by(is_active=True).count()
+    stats = get_dashboard_stats()
     
     # Get recent councillors
-    recent_councillors = Councillor.query.order_by(Councillor.updated_at.desc()).limit(5).all()
+    recent_councillors = get_recent_councillors()
     
-    return render_template_string('''
+    # Format the timestamp once here rather than through a filter call in the template
+    now = datetime.now()
+    now_display = format_uk_datetime(now)
+    
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Dashboard - Kesgrave CMS</title>
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+        <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+        <link rel="preload" href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" as="style" crossorigin="anonymous">
+        <link rel="preload" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" as="style" crossorigin="anonymous">
+        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet" crossorigin="anonymous">
+        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet" crossorigin="anonymous">
+        <link href="{{ admin_css_url }}" rel="stylesheet">
         <style>
-            {{ sidebar_css|safe }}
             .stat-card {
                 background: white;
                 border-radius: 10px;
@@ -759,7 +1101,7 @@ def dashboard():
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
                 <h1>📊 Dashboard</h1>
-                <div class="text-muted">{{ datetime.now()|uk_datetime }}</div>
+                <div class="text-muted">{{ now_display }}</div>
             </div>
             
             <!-- Statistics Cards -->
@@ -860,77 +1202,44 @@ def dashboard():
         <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
     </body>
     </html>
-    ''', total_councillors=total_councillors, published_councillors=published_councillors,
-         total_tags=total_tags, active_tags=active_tags, recent_councillors=recent_councillors,
-         content_count=ContentPage.query.count(),
-         events_count=Event.query.filter(Event.start_date >= datetime.now()).count(),
-         datetime=datetime, sidebar_html=get_sidebar_html('dashboard'), sidebar_css=get_sidebar_css())
+    ''', total_councillors=stats['total_councillors'], published_councillors=stats['published_councillors'],
+         total_tags=stats['total_tags'], active_tags=stats['active_tags'], recent_councillors=recent_councillors,
+         content_count=db.session.execute(select(func.count()).select_from(ContentPage)).scalar(),
+         events_count=db.session.execute(
+             select(func.count()).select_from(Event).where(Event.start_date >= now)
+         ).scalar(),
+         now_display=now_display, sidebar_html=get_sidebar_html('dashboard'))
 
 @app.route('/councillors')
 @login_required
 def councillors_list():
-    councillors = Councillor.query.order_by(Councillor.name).all()
-    
-    councillors_html = ""
-    for councillor in councillors:
-        social_links = get_social_links(councillor)
-        social_icons = ""
-        for platform, url in social_links.items():
-            if url:
-                icon_map = {
-                    'twitter': 'fab fa-twitter',
-                    'linkedin': 'fab fa-linkedin',
-                    'facebook': 'fab fa-facebook',
-                    'instagram': 'fab fa-instagram'
-                }
-                icon = icon_map.get(platform, 'fas fa-link')
-                social_icons += f'<a href="{url}" target="_blank" class="text-primary me-1"><i class="{icon}"></i></a>'
-        
-        tags_html = ""
-        for tag in councillor.tags:
-            tags_html += f'<span class="badge me-1" style="background-color: {tag.color}; color: white;">{tag.name}</span>'
-        
-        image_html = ""
-        if councillor.image_filename:
-            image_html = f'<img src="/uploads/councillors/{councillor.image_filename}" class="rounded-circle" width="40" height="40" style="object-fit: cover;">'
-        else:
-            image_html = '<div class="bg-secondary rounded-circle d-flex align-items-center justify-content-center" style="width: 40px; height: 40px;"><i class="fas fa-user text-white"></i></div>'
-        
-        councillors_html += f'''
-        <tr>
-            <td>
-                <div class="d-flex align-items-center">
-                    <div class="me-3">
-                        {image_html}
-                    </div>
-                    <div>
-                        <h6 class="mb-1">{councillor.name}</h6>
-                        <small class="text-muted">{councillor.title or "Councillor"}</small>
-                    </div>
-                </div>
-            </td>
-            <td>{tags_html}</td>
-            <td>{councillor.email or "Not provided"}</td>
-            <td>{social_icons}</td>
-            <td>
-                <span class="badge bg-{'success' if councillor.is_published else 'warning'}">
-                    {'Published' if councillor.is_published else 'Draft'}
-                </span>
-            </td>
-            <td>{councillor.updated_at.strftime('%d/%m/%Y')}</td>
-            <td>
-                <a href="/councillors/edit/{councillor.id}" class="btn btn-sm btn-outline-primary me-1">
-                    <i class="fas fa-edit"></i>
-                </a>
-                <a href="/councillors/delete/{councillor.id}" class="btn btn-sm btn-outline-danger" 
-                   onclick="return confirm('Delete {councillor.name}?')">
-                    <i class="fas fa-trash"></i>
-                </a>
-            </td>
-        </tr>
-        '''
-    
-    return render_template_string('''
+    # The page only changes when a councillor is saved, added or deleted, or a
+    # tag is renamed or recoloured, so answer repeat visits with a 304
+    latest, total = db.session.query(func.max(Councillor.updated_at), func.count(Councillor.id)).one()
+    tag_lookup = get_tag_lookup()
+    etag = hashlib.md5(repr((latest, total, sorted(tag_lookup.items()))).encode()).hexdigest()
+    if etag_matches(etag):
+        return not_modified_response(etag)
+    
+    # Badges come from the association rows plus the cached tag lookup, so no
+    # Tag objects are loaded for this page; the long text columns (bio, intro,
+    # address, qualifications) are never shown here, so they are not selected
+    councillors = db.session.execute(
+        select(Councillor).options(*list_view_options(
+            lazyload(Councillor.tags),
+            load_only(
+                Councillor.name, Councillor.title, Councillor.email, Councillor.image_filename,
+                Councillor.social_links, Councillor.is_published, Councillor.updated_at
+            )
+        )).order_by(Councillor.name)
+    ).scalars().all()
+    tag_ids_by_councillor = get_councillor_tag_ids()
+    if any(tag_id not in tag_lookup for tag_ids in tag_ids_by_councillor.values() for tag_id in tag_ids):
+        # A tag was added by another worker since the lookup was cached
+        invalidate_tag_cache()
+        tag_lookup = get_tag_lookup()
+    
+    return revalidated_response(render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -939,66 +1248,10 @@ def councillors_list():
         <title>Councillors - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link active">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -1010,7 +1263,7 @@ def councillors_list():
             
             <div class="card">
                 <div class="card-header">
-                    <h5 class="mb-0">All Councillors ({{ councillors|length }})</h5>
+                    <h5 class="mb-0">All Councillors ({{ councillor_count }})</h5>
                 </div>
                 <div class="card-body p-0">
                     <div class="table-responsive">
@@ -1027,7 +1280,50 @@ def councillors_list():
                                 </tr>
                             </thead>
                             <tbody>
-                                {{ councillors_html|safe }}
+                                {% for councillor in councillors %}
+                                <tr>
+                                    <td>
+                                        <div class="d-flex align-items-center">
+                                            <div class="me-3">
+                                                {% if councillor.image_filename %}
+                                                <img src="{{ councillor.image_filename|thumbnail_url('councillors') }}" class="rounded-circle" width="40" height="40" style="object-fit: cover;">
+                                                {% else %}
+                                                <div class="bg-secondary rounded-circle d-flex align-items-center justify-content-center" style="width: 40px; height: 40px;"><i class="fas fa-user text-white"></i></div>
+                                                {% endif %}
+                                            </div>
+                                            <div>
+                                                <h6 class="mb-1">{{ councillor.name }}</h6>
+                                                <small class="text-muted">{{ councillor.title or "Councillor" }}</small>
+                                            </div>
+                                        </div>
+                                    </td>
+                                    <td>
+                                        {% for tag_id in tag_ids_by_councillor.get(councillor.id, ()) if tag_id in tag_lookup %}
+                                        {% set tag_name, tag_color = tag_lookup[tag_id] %}
+                                        <span class="badge me-1" style="background-color: {{ tag_color }}; color: white;">{{ tag_name }}</span>
+                                        {% endfor %}
+                                    </td>
+                                    <td>{{ councillor.email or "Not provided" }}</td>
+                                    <td>{{ councillor.social_links|social_icons }}</td>
+                                    <td>
+                                        <span class="badge bg-{{ 'success' if councillor.is_published else 'warning' }}">
+                                            {{ 'Published' if councillor.is_published else 'Draft' }}
+                                        </span>
+                                    </td>
+                                    <td>{{ councillor.updated_at|uk_date }}</td>
+                                    <td>
+                                        <a href="/councillors/edit/{{ councillor.id }}" class="btn btn-sm btn-outline-primary me-1">
+                                            <i class="fas fa-edit"></i>
+                                        </a>
+                                        <form method="POST" action="/councillors/delete/{{ councillor.id }}" class="d-inline"
+                                              onsubmit='return confirm({{ ("Delete " ~ councillor.name ~ "?")|tojson }})'>
+                                            <button type="submit" class="btn btn-sm btn-outline-danger">
+                                                <i class="fas fa-trash"></i>
+                                            </button>
+                                        </form>
+                                    </td>
+                                </tr>
+                                {% endfor %}
                             </tbody>
                         </table>
                     </div>
@@ -1036,7 +1332,7 @@ def councillors_list():
         </div>
     </body>
     </html>
-    ''', councillors=councillors, councillors_html=councillors_html)
+    ''', councillors=councillors, councillor_count=total, tag_ids_by_councillor=tag_ids_by_councillor, tag_lookup=tag_lookup, sidebar_html=get_sidebar_html('councillors')), etag, latest)
 
 
 @app.route('/councillors/add', methods=['GET', 'POST'])
@@ -1065,30 +1361,29 @@ def add_councillor():
         
         # Handle social links
         social_links = {}
-        for platform in ['twitter', 'linkedin', 'facebook', 'instagram']:
+        for platform in SOCIAL_ICON_MAP:
             url = request.form.get(f'social_{platform}')
             if url:
                 social_links[platform] = url
-        set_social_links(councillor, social_links)
+        councillor.social_links = social_links
         
         db.session.add(councillor)
-        db.session.commit()
+        db.session.flush()  # Get the ID
         
-        # Handle tags
-        tag_ids = request.form.getlist('tags')
-        for tag_id in tag_ids:
-            if tag_id:
-                councillor_tag = CouncillorTag(councillor_id=councillor.id, tag_id=int(tag_id))
-                db.session.add(councillor_tag)
+        # Handle tags - one executemany INSERT for all selected tags
+        tag_rows = [{'councillor_id': councillor.id, 'tag_id': int(tag_id)} for tag_id in request.form.getlist('tags') if tag_id]
+        if tag_rows:
+            db.session.execute(councillor_tag.insert(), tag_rows)
         
         db.session.commit()
+        invalidate_dashboard_cache()
         flash('Councillor added successfully!', 'success')
         return redirect(url_for('councillors_list'))
     
     # GET request - show form
-    tags = Tag.query.filter_by(is_active=True).order_by(Tag.name).all()
+    tags = get_active_tags()
     
-    return render_template_string('''
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -1097,66 +1392,10 @@ def add_councillor():
         <title>Add Councillor - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link active">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -1247,30 +1486,14 @@ def add_councillor():
                         <div class="mb-3">
                             <label class="form-label">Social Media Links</label>
                             <div class="row">
+                                {% for platform, icon, placeholder in social_platforms %}
                                 <div class="col-md-6 mb-2">
                                     <div class="input-group">
-                                        <span class="input-group-text"><i class="fab fa-twitter"></i></span>
-                                        <input type="url" class="form-control" name="social_twitter" placeholder="Twitter/X URL">
-                                    </div>
-                                </div>
-                                <div class="col-md-6 mb-2">
-                                    <div class="input-group">
-                                        <span class="input-group-text"><i class="fab fa-linkedin"></i></span>
-                                        <input type="url" class="form-control" name="social_linkedin" placeholder="LinkedIn URL">
-                                    </div>
-                                </div>
-                                <div class="col-md-6 mb-2">
-                                    <div class="input-group">
-                                        <span class="input-group-text"><i class="fab fa-facebook"></i></span>
-                                        <input type="url" class="form-control" name="social_facebook" placeholder="Facebook URL">
-                                    </div>
-                                </div>
-                                <div class="col-md-6 mb-2">
-                                    <div class="input-group">
-                                        <span class="input-group-text"><i class="fab fa-instagram"></i></span>
-                                        <input type="url" class="form-control" name="social_instagram" placeholder="Instagram URL">
+                                        <span class="input-group-text"><i class="{{ icon }}"></i></span>
+                                        <input type="url" class="form-control" name="social_{{ platform }}" placeholder="{{ placeholder }}">
                                     </div>
                                 </div>
+                                {% endfor %}
                             </div>
                         </div>
                         
@@ -1295,12 +1518,17 @@ def add_councillor():
         </div>
     </body>
     </html>
-    ''', tags=tags)
+    ''', tags=tags, social_platforms=SOCIAL_PLATFORMS, sidebar_html=get_sidebar_html('councillors'))
 
 @app.route('/councillors/edit/<int:councillor_id>', methods=['GET', 'POST'])
 @login_required
 def edit_councillor(councillor_id):
-    councillor = Councillor.query.get_or_404(councillor_id)
+    # The form's current tags come in with the relationship's selectin default;
+    # a POST rewrites the association rows directly and never touches the collection
+    query = Councillor.query
+    if request.method == 'POST':
+        query = query.options(lazyload(Councillor.tags))
+    councillor = query.filter_by(id=councillor_id).first_or_404()
     
     if request.method == 'POST':
         # Update councillor data
@@ -1324,30 +1552,40 @@ def edit_councillor(councillor_id):
         
         # Handle social links
         social_links = {}
-        for platform in ['twitter', 'linkedin', 'facebook', 'instagram']:
+        for platform in SOCIAL_ICON_MAP:
             url = request.form.get(f'social_{platform}')
             if url:
                 social_links[platform] = url
-        set_social_links(councillor, social_links)
-        
-        # Update tags - remove existing and add new ones
-        CouncillorTag.query.filter_by(councillor_id=councillor.id).delete()
-        tag_ids = request.form.getlist('tags')
-        for tag_id in tag_ids:
-            if tag_id:
-                councillor_tag = CouncillorTag(councillor_id=councillor.id, tag_id=int(tag_id))
-                db.session.add(councillor_tag)
+        councillor.social_links = social_links
+        
+        # Update tags - only write the associations that actually changed
+        current_tag_ids = set(db.session.execute(
+            select(councillor_tag.c.tag_id).where(councillor_tag.c.councillor_id == councillor.id)
+        ).scalars())
+        new_tag_ids = {int(tag_id) for tag_id in request.form.getlist('tags') if tag_id}
+        removed_tag_ids = current_tag_ids - new_tag_ids
+        if removed_tag_ids:
+            db.session.execute(councillor_tag.delete().where(
+                councillor_tag.c.councillor_id == councillor.id,
+                councillor_tag.c.tag_id.in_(removed_tag_ids)
+            ))
+        added_tag_ids = new_tag_ids - current_tag_ids
+        if added_tag_ids:
+            db.session.execute(councillor_tag.insert(), [
+                {'councillor_id': councillor.id, 'tag_id': tag_id} for tag_id in added_tag_ids
+            ])
         
         db.session.commit()
+        invalidate_dashboard_cache()
         flash('Councillor updated successfully!', 'success')
         return redirect(url_for('councillors_list'))
     
     # GET request - show form with existing data
-    tags = Tag.query.filter_by(is_active=True).order_by(Tag.name).all()
-    councillor_tag_ids = [ct.tag_id for ct in CouncillorTag.query.filter_by(councillor_id=councillor.id).all()]
-    social_links = get_social_links(councillor)
+    tags = get_active_tags()
+    councillor_tag_ids = [tag.id for tag in councillor.tags]
+    social_links = councillor.social_links or {}
     
-    return render_template_string('''
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -1356,66 +1594,10 @@ def edit_councillor(councillor_id):
         <title>Edit Councillor - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link active">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -1513,30 +1695,14 @@ def edit_councillor(councillor_id):
                         <div class="mb-3">
                             <label class="form-label">Social Media Links</label>
                             <div class="row">
+                                {% for platform, icon, placeholder in social_platforms %}
                                 <div class="col-md-6 mb-2">
                                     <div class="input-group">
-                                        <span class="input-group-text"><i class="fab fa-twitter"></i></span>
-                                        <input type="url" class="form-control" name="social_twitter" value="{{ social_links.get('twitter', '') }}" placeholder="Twitter/X URL">
-                                    </div>
-                                </div>
-                                <div class="col-md-6 mb-2">
-                                    <div class="input-group">
-                                        <span class="input-group-text"><i class="fab fa-linkedin"></i></span>
-                                        <input type="url" class="form-control" name="social_linkedin" value="{{ social_links.get('linkedin', '') }}" placeholder="LinkedIn URL">
-                                    </div>
-                                </div>
-                                <div class="col-md-6 mb-2">
-                                    <div class="input-group">
-                                        <span class="input-group-text"><i class="fab fa-facebook"></i></span>
-                                        <input type="url" class="form-control" name="social_facebook" value="{{ social_links.get('facebook', '') }}" placeholder="Facebook URL">
-                                    </div>
-                                </div>
-                                <div class="col-md-6 mb-2">
-                                    <div class="input-group">
-                                        <span class="input-group-text"><i class="fab fa-instagram"></i></span>
-                                        <input type="url" class="form-control" name="social_instagram" value="{{ social_links.get('instagram', '') }}" placeholder="Instagram URL">
+                                        <span class="input-group-text"><i class="{{ icon }}"></i></span>
+                                        <input type="url" class="form-control" name="social_{{ platform }}" value="{{ social_links.get(platform, '') }}" placeholder="{{ placeholder }}">
                                     </div>
                                 </div>
+                                {% endfor %}
                             </div>
                         </div>
                         
@@ -1561,61 +1727,46 @@ def edit_councillor(councillor_id):
         </div>
     </body>
     </html>
-    ''', councillor=councillor, tags=tags, councillor_tag_ids=councillor_tag_ids, social_links=social_links)
+    ''', councillor=councillor, tags=tags, councillor_tag_ids=councillor_tag_ids, social_links=social_links, social_platforms=SOCIAL_PLATFORMS, sidebar_html=get_sidebar_html('councillors'))
 
-@app.route('/councillors/delete/<int:councillor_id>')
+@app.route('/councillors/delete/<int:councillor_id>', methods=['POST'])
 @login_required
 def delete_councillor(councillor_id):
-    councillor = Councillor.query.get_or_404(councillor_id)
-    
     # Delete associated tags
-    CouncillorTag.query.filter_by(councillor_id=councillor.id).delete()
+    db.session.execute(councillor_tag.delete().where(councillor_tag.c.councillor_id == councillor_id))
     
-    # Delete the councillor
-    db.session.delete(councillor)
+    # Delete the councillor directly - nothing needs loading first
+    deleted = Councillor.query.filter_by(id=councillor_id).delete(synchronize_session=False)
+    if not deleted:
+        abort(404)
     db.session.commit()
+    invalidate_dashboard_cache()
     
-    flash(f'Councillor {councillor.name} deleted successfully!', 'success')
+    flash('Councillor deleted successfully!', 'success')
     return redirect(url_for('councillors_list'))
 
 # Tags management routes
 @app.route('/tags')
 @login_required
 def tags_list():
-    tags = Tag.query.order_by(Tag.name).all()
-    
-    tags_html = ""
-    for tag in tags:
-        councillor_count = len(tag.councillors)
-        
-        tags_html += f'''
-        <tr>
-            <td>
-                <span class="badge" style="background-color: {tag.color}; color: white; font-size: 0.9rem;">
-                    {tag.name}
-                </span>
-            </td>
-            <td>{tag.description or "No description"}</td>
-            <td>{councillor_count} councillor{'s' if councillor_count != 1 else ''}</td>
-            <td>
-                <span class="badge bg-{'success' if tag.is_active else 'secondary'}">
-                    {'Active' if tag.is_active else 'Inactive'}
-                </span>
-            </td>
-            <td>{tag.created_at.strftime('%d/%m/%Y')}</td>
-            <td>
-                <a href="/tags/edit/{tag.id}" class="btn btn-sm btn-outline-primary me-1">
-                    <i class="fas fa-edit"></i>
-                </a>
-                <a href="/tags/delete/{tag.id}" class="btn btn-sm btn-outline-danger" 
-                   onclick="return confirm('Delete tag {tag.name}? This will remove it from all councillors.')">
-                    <i class="fas fa-trash"></i>
-                </a>
-            </td>
-        </tr>
-        '''
+    return render_tags_page()
+
+@cache.memoize(timeout=300)
+def render_tags_page():
+    """Render the tags page HTML - cached until a councillor or tag changes"""
+    # Only the displayed columns plus each tag's usage count, as lightweight
+    # rows from a single outer-joined GROUP BY
+    tags = db.session.execute(
+        select(
+            Tag.id, Tag.name, Tag.description, Tag.color, Tag.is_active, Tag.created_at,
+            func.count(councillor_tag.c.councillor_id).label('councillor_count')
+        )
+        .outerjoin(councillor_tag, councillor_tag.c.tag_id == Tag.id)
+        .group_by(Tag.id)
+        .order_by(Tag.name)
+    ).all()
     
-    return render_template_string('''
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -1624,66 +1775,10 @@ def tags_list():
         <title>Ward Tags - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link active">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -1711,7 +1806,35 @@ def tags_list():
                                 </tr>
                             </thead>
                             <tbody>
-                                {{ tags_html|safe }}
+                                {% for tag in tags %}
+                                {% set councillor_count = tag.councillor_count %}
+                                <tr>
+                                    <td>
+                                        <span class="badge" style="background-color: {{ tag.color }}; color: white; font-size: 0.9rem;">
+                                            {{ tag.name }}
+                                        </span>
+                                    </td>
+                                    <td>{{ tag.description or "No description" }}</td>
+                                    <td>{{ councillor_count }} councillor{{ 's' if councillor_count != 1 else '' }}</td>
+                                    <td>
+                                        <span class="badge bg-{{ 'success' if tag.is_active else 'secondary' }}">
+                                            {{ 'Active' if tag.is_active else 'Inactive' }}
+                                        </span>
+                                    </td>
+                                    <td>{{ tag.created_at|uk_date }}</td>
+                                    <td>
+                                        <a href="/tags/edit/{{ tag.id }}" class="btn btn-sm btn-outline-primary me-1">
+                                            <i class="fas fa-edit"></i>
+                                        </a>
+                                        <form method="POST" action="/tags/delete/{{ tag.id }}" class="d-inline"
+                                              onsubmit='return confirm({{ ("Delete tag " ~ tag.name ~ "? This will remove it from all councillors.")|tojson }})'>
+                                            <button type="submit" class="btn btn-sm btn-outline-danger">
+                                                <i class="fas fa-trash"></i>
+                                            </button>
+                                        </form>
+                                    </td>
+                                </tr>
+                                {% endfor %}
                             </tbody>
                         </table>
                     </div>
@@ -1720,7 +1843,7 @@ def tags_list():
         </div>
     </body>
     </html>
-    ''', tags=tags, tags_html=tags_html)
+    ''', tags=tags, sidebar_html=get_sidebar_html('tags'))
 
 @app.route('/tags/add', methods=['GET', 'POST'])
 @login_required
@@ -1735,11 +1858,13 @@ def add_tag():
         
         db.session.add(tag)
         db.session.commit()
+        invalidate_dashboard_cache()
+        invalidate_tag_cache()
         
         flash('Tag created successfully!', 'success')
         return redirect(url_for('tags_list'))
     
-    return render_template_string('''
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -1748,66 +1873,10 @@ def add_tag():
         <title>Add Tag - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link active">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -1860,7 +1929,7 @@ def add_tag():
         </div>
     </body>
     </html>
-    ''')
+    ''', sidebar_html=get_sidebar_html('tags'))
 
 @app.route('/tags/edit/<int:tag_id>', methods=['GET', 'POST'])
 @login_required
@@ -1874,10 +1943,12 @@ def edit_tag(tag_id):
         tag.is_active = bool(request.form.get('is_active'))
         
         db.session.commit()
+        invalidate_dashboard_cache()
+        invalidate_tag_cache()
         flash('Tag updated successfully!', 'success')
         return redirect(url_for('tags_list'))
     
-    return render_template_string('''
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -1886,66 +1957,10 @@ def edit_tag(tag_id):
         <title>Edit Tag - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link active">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -1998,21 +2013,23 @@ def edit_tag(tag_id):
         </div>
     </body>
     </html>
-    ''', tag=tag)
+    ''', tag=tag, sidebar_html=get_sidebar_html('tags'))
 
-@app.route('/tags/delete/<int:tag_id>')
+@app.route('/tags/delete/<int:tag_id>', methods=['POST'])
 @login_required
 def delete_tag(tag_id):
-    tag = Tag.query.get_or_404(tag_id)
-    
     # Delete associated councillor tags
-    CouncillorTag.query.filter_by(tag_id=tag.id).delete()
+    db.session.execute(councillor_tag.delete().where(councillor_tag.c.tag_id == tag_id))
     
-    # Delete the tag
-    db.session.delete(tag)
+    # Delete the tag directly - nothing needs loading first
+    deleted = Tag.query.filter_by(id=tag_id).delete(synchronize_session=False)
+    if not deleted:
+        abort(404)
     db.session.commit()
+    invalidate_dashboard_cache()
+    invalidate_tag_cache()
     
-    flash(f'Tag {tag.name} deleted successfully!', 'success')
+    flash('Tag deleted successfully!', 'success')
     return redirect(url_for('tags_list'))
 
 
@@ -2021,30 +2038,37 @@ def delete_tag(tag_id):
 @login_required
 def content_dashboard():
     # Get real categories with page counts
-    db_categories = ContentCategory.query.filter_by(is_active=True).all()
+    db_categories = ContentCategory.query.options(*list_view_options()).filter_by(is_active=True).all()
+    page_counts = dict(db.session.execute(
+        select(ContentPage.category_id, func.count(ContentPage.id)).group_by(ContentPage.category_id)
+    ).all())
     categories = []
     for cat in db_categories:
-        page_count = ContentPage.query.filter_by(category_id=cat.id).count()
         categories.append({
             'name': cat.name,
-            'count': page_count,
+            'count': page_counts.get(cat.id, 0),
             'color': cat.color or '#3498db'
         })
     
     # Get recent pages from database
-    recent_db_pages = ContentPage.query.order_by(ContentPage.updated_at.desc()).limit(5).all()
+    # Only the displayed columns, with the category name joined in, so no
+    # ContentPage objects are built and no per-page category query is issued
+    recent_rows = db.session.execute(
+        select(ContentPage.title, ContentCategory.name, ContentPage.status, ContentPage.updated_at, ContentPage.created_at)
+        .outerjoin(ContentCategory, ContentPage.category_id == ContentCategory.id)
+        .order_by(ContentPage.updated_at.desc())
+        .limit(5)
+    ).all()
     recent_pages = []
-    for page in recent_db_pages:
-        category_name = page.category.name if page.category else 'Uncategorized'
-        updated_date = page.updated_at.strftime('%d/%m/%Y') if page.updated_at else page.created_at.strftime('%d/%m/%Y') if page.created_at else ''
+    for title, category_name, status, updated_at, created_at in recent_rows:
         recent_pages.append({
-            'title': page.title,
-            'category': category_name,
-            'status': page.status,
-            'updated': updated_date
+            'title': title,
+            'category': category_name or 'Uncategorized',
+            'status': status,
+            'updated': format_uk_date(updated_at or created_at) or ''
         })
     
-    return render_template_string('''
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -2053,34 +2077,8 @@ def content_dashboard():
         <title>Content Management - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+        <link href="{{ admin_css_url }}" rel="stylesheet">
         <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
             .stat-card {
                 background: white;
                 border-radius: 10px;
@@ -2094,35 +2092,7 @@ def content_dashboard():
         </style>
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link active">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -2255,20 +2225,79 @@ def content_dashboard():
         </div>
     </body>
     </html>
-    ''', categories=categories, recent_pages=recent_pages)
+    ''', categories=categories, recent_pages=recent_pages, sidebar_html=get_sidebar_html('content'))
+
+def encode_page_cursor(created_at, page_id):
+    """Opaque pagination token for a content page's (created_at, id) position"""
+    raw = json.dumps([created_at.isoformat(), page_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_page_cursor(token):
+    """(created_at, id) from a pagination token, or None if missing or malformed"""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        created_at, page_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(page_id)
+    except (ValueError, TypeError):
+        return None
+
+def get_content_list_etag():
+    """ETag and last-modified time for the content list pages at the current URL"""
+    latest, total = db.session.query(func.max(ContentPage.updated_at), func.count(ContentPage.id)).one()
+    etag = hashlib.md5(repr((latest, total, get_category_version(), request.full_path)).encode()).hexdigest()
+    return etag, latest
+
+def etag_matches(etag):
+    """True if the request's If-None-Match holds this ETag, as sent plain or gzipped"""
+    return request.if_none_match.contains(etag) or request.if_none_match.contains(etag + GZIP_ETAG_SUFFIX)
+
+def not_modified_response(etag):
+    """Empty 304 answer for a request whose If-None-Match already has this ETag"""
+    # Echo the tag of the representation the client holds
+    if request.if_none_match.contains(etag + GZIP_ETAG_SUFFIX):
+        etag += GZIP_ETAG_SUFFIX
+    response = make_response('', 304)
+    response.set_etag(etag)
+    return response
+
+def revalidated_response(body, etag, last_modified):
+    """Response the browser may keep but must check back for with its ETag every time"""
+    response = make_response(body)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
 
 @app.route('/content/pages')
 @login_required
 def content_pages_list():
+    # The list only changes when a page or category is saved, added or deleted
+    etag, latest = get_content_list_etag()
+    if etag_matches(etag):
+        return not_modified_response(etag)
+    
     # Get filter parameters
     category_filter = request.args.get('category')
     status_filter = request.args.get('status')
     search_query = request.args.get('search', '')
-    page_num = int(request.args.get('page', 1))
+    # Keyset pagination: 'after' continues past the last row shown, 'before'
+    # steps back from the first, so no page costs more than per_page rows
+    after_cursor = decode_page_cursor(request.args.get('after'))
+    before_cursor = decode_page_cursor(request.args.get('before'))
     per_page = 20
     
-    # Build database query
-    query = ContentPage.query
+    # Build database query - the category comes back in the same query, and
+    # only the listed columns are selected (never the long_description body)
+    query = ContentPage.query.options(
+        load_only(
+            ContentPage.title, ContentPage.short_description, ContentPage.status,
+            ContentPage.created_at, ContentPage.updated_at
+        ),
+        joinedload(ContentPage.category).load_only(ContentCategory.name)
+    )
     
     # Apply filters
     if category_filter:
@@ -2283,116 +2312,56 @@ def content_pages_list():
     if search_query:
         query = query.filter(ContentPage.title.contains(search_query))
     
-    # Get total count for pagination
-    total_pages = query.count()
-    
-    # Apply pagination
-    pages_query = query.order_by(ContentPage.created_at.desc()).offset((page_num - 1) * per_page).limit(per_page)
-    db_pages = pages_query.all()
-    
-    # Convert database objects to template-friendly format
-    pages = []
-    for page in db_pages:
-        category_name = page.category.name if page.category else 'Uncategorized'
-        pages.append({
-            'id': page.id,
-            'title': page.title,
-            'category': category_name,
-            'status': page.status,
-            'author': 'Admin User',  # You can add author field to ContentPage model later
-            'created': page.created_at.strftime('%d/%m/%Y') if page.created_at else '',
-            'updated': page.updated_at.strftime('%d/%m/%Y') if page.updated_at else page.created_at.strftime('%d/%m/%Y') if page.created_at else '',
-            'views': 0,  # You can add views field to ContentPage model later
-            'summary': page.short_description or 'No description available'
-        })
+    # Apply pagination - fetch one extra row to learn whether another page follows.
+    # A window count rides along on each row, so the first page learns the
+    # filtered total without a separate COUNT query; pages reached through a
+    # cursor only know whether more rows follow
+    query = query.add_columns(func.count().over())
+    position = tuple_(ContentPage.created_at, ContentPage.id)
+    if before_cursor:
+        rows = query.filter(position > before_cursor).order_by(
+            ContentPage.created_at, ContentPage.id
+        ).limit(per_page + 1).all()
+        has_prev = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        has_next = True
+    else:
+        if after_cursor:
+            query = query.filter(position < after_cursor)
+        rows = query.order_by(
+            ContentPage.created_at.desc(), ContentPage.id.desc()
+        ).limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        has_prev = after_cursor is not None
+    db_pages = [page for page, _ in rows]
+    if after_cursor or before_cursor:
+        total_pages = None
+    else:
+        total_pages = rows[0][1] if rows else 0
     
-    total_page_count = (total_pages + per_page - 1) // per_page
-    
-    # Generate pagination HTML
-    pagination_html = ""
-    if total_page_count > 1:
-        pagination_html = '<nav><ul class="pagination justify-content-center">'
-        
-        # Previous button
-        if page_num > 1:
-            prev_url = f"/content/pages?page={page_num-1}"
-            if category_filter:
-                prev_url += f"&category={category_filter}"
-            if status_filter:
-                prev_url += f"&status={status_filter}"
-            if search_query:
-                prev_url += f"&search={search_query}"
-            pagination_html += f'<li class="page-item"><a class="page-link" href="{prev_url}">Previous</a></li>'
-        
-        # Page numbers (show 5 pages around current)
-        start_page = max(1, page_num - 2)
-        end_page = min(total_page_count, page_num + 2)
-        
-        for p in range(start_page, end_page + 1):
-            page_url = f"/content/pages?page={p}"
-            if category_filter:
-                page_url += f"&category={category_filter}"
-            if status_filter:
-                page_url += f"&status={status_filter}"
-            if search_query:
-                page_url += f"&search={search_query}"
-            
-            active_class = "active" if p == page_num else ""
-            pagination_html += f'<li class="page-item {active_class}"><a class="page-link" href="{page_url}">{p}</a></li>'
-        
-        # Next button
-        if page_num < total_page_count:
-            next_url = f"/content/pages?page={page_num+1}"
-            if category_filter:
-                next_url += f"&category={category_filter}"
-            if status_filter:
-                next_url += f"&status={status_filter}"
-            if search_query:
-                next_url += f"&search={search_query}"
-            pagination_html += f'<li class="page-item"><a class="page-link" href="{next_url}">Next</a></li>'
-        
-        pagination_html += '</ul></nav>'
+    # Pagination links are rendered by the template from the boundary cursors,
+    # carrying the active filters along
+    prev_cursor = encode_page_cursor(db_pages[0].created_at, db_pages[0].id) if db_pages and has_prev else None
+    next_cursor = encode_page_cursor(db_pages[-1].created_at, db_pages[-1].id) if db_pages and has_next else None
+    filter_args = {key: value for key, value in (
+        ('category', category_filter), ('status', status_filter), ('search', search_query)
+    ) if value}
     
     # Get categories for filter dropdown
-    categories = ContentCategory.query.filter_by(is_active=True).all()
+    categories = get_active_categories()
     
-    return render_template_string('''
+    return revalidated_response(render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>All Content Pages - Kesgrave CMS</title>
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>All Content Pages - Kesgrave CMS</title>
+        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
+        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+        <link href="{{ admin_css_url }}" rel="stylesheet">
+        <style>
             .filter-card {
                 background: white;
                 border-radius: 10px;
@@ -2401,35 +2370,7 @@ def content_pages_list():
         </style>
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link active">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -2487,7 +2428,10 @@ def content_pages_list():
             <div class="d-flex justify-content-between align-items-center mb-3">
                 <div>
                     <h5 class="mb-0">
-                        Showing {{ pages|length }} of {{ total_pages }} pages
+                        Showing {{ pages|length }}{% if total_pages is not none %} of {{ total_pages }}{% endif %} pages
+                        {% if total_pages is none and next_cursor %}
+                        <small class="text-muted">(more available)</small>
+                        {% endif %}
                         {% if category_filter or status_filter or search_query %}
                         <small class="text-muted">(filtered)</small>
                         {% endif %}
@@ -2531,20 +2475,20 @@ def content_pages_list():
                                     <td>
                                         <div>
                                             <h6 class="mb-1">{{ page.title }}</h6>
-                                            <small class="text-muted">{{ page.summary }}</small>
+                                            <small class="text-muted">{{ page.short_description or 'No description available' }}</small>
                                         </div>
                                     </td>
                                     <td>
-                                        <span class="badge bg-secondary">{{ page.category }}</span>
+                                        <span class="badge bg-secondary">{{ page.category.name if page.category else 'Uncategorized' }}</span>
                                     </td>
                                     <td>
                                         <span class="badge bg-{{ 'success' if page.status == 'Published' else 'warning' if page.status == 'Draft' else 'secondary' }}">
                                             {{ page.status }}
                                         </span>
                                     </td>
-                                    <td>{{ page.author }}</td>
-                                    <td>{{ page.updated }}</td>
-                                    <td>{{ page.views }}</td>
+                                    <td>Admin User</td>
+                                    <td>{{ (page.updated_at or page.created_at)|uk_date }}</td>
+                                    <td>0</td>
                                     <td>
                                         <div class="btn-group btn-group-sm">
                                             <a href="/content/edit/{{ page.id }}" class="btn btn-outline-primary" title="Edit">
@@ -2568,7 +2512,16 @@ def content_pages_list():
             
             <!-- Pagination -->
             <div class="mt-4">
-                {{ pagination_html|safe }}
+                {% if prev_cursor or next_cursor %}
+                <nav><ul class="pagination justify-content-center">
+                    {% if prev_cursor %}
+                    <li class="page-item"><a class="page-link" href="{{ url_for('content_pages_list', before=prev_cursor, **filter_args) }}">Previous</a></li>
+                    {% endif %}
+                    {% if next_cursor %}
+                    <li class="page-item"><a class="page-link" href="{{ url_for('content_pages_list', after=next_cursor, **filter_args) }}">Next</a></li>
+                    {% endif %}
+                </ul></nav>
+                {% endif %}
             </div>
             
             <!-- Bulk Actions Panel (hidden by default) -->
@@ -2609,15 +2562,27 @@ def content_pages_list():
         </script>
     </body>
     </html>
-    ''', pages=pages, total_pages=total_pages, category_filter=category_filter, 
-         status_filter=status_filter, search_query=search_query, pagination_html=pagination_html, categories=categories)
+    ''', pages=db_pages, total_pages=total_pages, category_filter=category_filter, 
+         status_filter=status_filter, search_query=search_query, prev_cursor=prev_cursor, next_cursor=next_cursor, filter_args=filter_args, categories=categories, sidebar_html=get_sidebar_html('content')), etag, latest)
 
 # Content category management routes
 @app.route('/content/categories')
 @login_required
 def content_categories():
-    categories = ContentCategory.query.all()
-    return render_template_string('''
+    etag, latest = get_content_list_etag()
+    if etag_matches(etag):
+        return not_modified_response(etag)
+    
+    # The table only shows how many subcategories and pages each category has,
+    # so count them in the database alongside each category in one query
+    subcategory_count = select(func.count(ContentSubcategory.id)).where(
+        ContentSubcategory.category_id == ContentCategory.id
+    ).scalar_subquery()
+    page_count = select(func.count(ContentPage.id)).where(
+        ContentPage.category_id == ContentCategory.id
+    ).scalar_subquery()
+    categories = db.session.execute(select(ContentCategory, subcategory_count, page_count)).all()
+    return revalidated_response(render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -2626,66 +2591,10 @@ def content_categories():
         <title>Manage Categories - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link active">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -2715,7 +2624,7 @@ def content_categories():
                                 </tr>
                             </thead>
                             <tbody>
-                                {% for category in categories %}
+                                {% for category, subcategory_count, page_count in categories %}
                                 <tr>
                                     <td>
                                         <div class="d-flex align-items-center">
@@ -2729,8 +2638,8 @@ def content_categories():
                                         </div>
                                     </td>
                                     <td><code>{{ category.url_path or '/' + category.name.lower().replace(' ', '-') }}</code></td>
-                                    <td>{{ category.subcategories|length }}</td>
-                                    <td>{{ category.pages|length }}</td>
+                                    <td>{{ subcategory_count }}</td>
+                                    <td>{{ page_count }}</td>
                                     <td>
                                         <span class="badge bg-{{ 'success' if category.is_active else 'secondary' }}">
                                             {{ 'Active' if category.is_active else 'Inactive' }}
@@ -2780,7 +2689,10 @@ def content_categories():
         </script>
     </body>
     </html>
-    ''', categories=categories)
+    ''', categories=categories, sidebar_html=get_sidebar_html('content')), etag, latest)
+
+# Site paths a content category may not claim
+RESERVED_CATEGORY_PATHS = frozenset({'/councillors', '/ktc-meetings', '/contact', '/admin', '/login'})
 
 @app.route('/content/categories/add', methods=['GET', 'POST'])
 @login_required
@@ -2792,13 +2704,12 @@ def add_content_category():
         url_path = request.form.get('url_path')
         
         # Validate reserved paths
-        reserved_paths = ['/councillors', '/ktc-meetings', '/contact', '/admin', '/login']
-        if url_path in reserved_paths:
+        if url_path in RESERVED_CATEGORY_PATHS:
             flash('This URL path is reserved and cannot be used.', 'error')
             return redirect(request.url)
         
         # Check if URL path already exists
-        existing = ContentCategory.query.filter_by(url_path=url_path).first()
+        existing = db.session.query(ContentCategory.id).filter_by(url_path=url_path).first()
         if existing:
             flash('This URL path is already in use.', 'error')
             return redirect(request.url)
@@ -2829,78 +2740,25 @@ def add_content_category():
                 db.session.add(subcategory)
         
         db.session.commit()
+        invalidate_category_cache()
         flash('Category created successfully!', 'success')
         return redirect(url_for('content_categories'))
     
-    return render_template_string('''
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Add Category - Kesgrave CMS</title>
+        <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link active">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -2972,6 +2830,21 @@ def add_content_category():
                                     </div>
                                 </div>
                             </div>
+                            <template id="subcategoryRowTemplate">
+                                <div class="row mb-2">
+                                    <div class="col-md-6">
+                                        <input type="text" class="form-control" name="subcategory_name[]" placeholder="Subcategory name">
+                                    </div>
+                                    <div class="col-md-5">
+                                        <input type="text" class="form-control" name="subcategory_path[]" placeholder="/subcategory-path">
+                                    </div>
+                                    <div class="col-md-1">
+                                        <button type="button" class="btn btn-outline-danger" onclick="removeSubcategory(this)">
+                                            <i class="fas fa-trash"></i>
+                                        </button>
+                                    </div>
+                                </div>
+                            </template>
                             <button type="button" class="btn btn-outline-primary btn-sm" onclick="addSubcategory()">
                                 <i class="fas fa-plus me-1"></i>Add Subcategory
                             </button>
@@ -2988,26 +2861,15 @@ def add_content_category():
             </div>
         </div>
         
-        <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+        <script defer src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
         <script>
+            // New rows are cloned from the <template>, which the browser has
+            // already parsed, instead of re-parsing an HTML string per click
+            const subcategoryRowTemplate = document.getElementById('subcategoryRowTemplate');
+            
             function addSubcategory() {
                 const container = document.getElementById('subcategories');
-                const div = document.createElement('div');
-                div.className = 'row mb-2';
-                div.innerHTML = `
-                    <div class="col-md-6">
-                        <input type="text" class="form-control" name="subcategory_name[]" placeholder="Subcategory name">
-                    </div>
-                    <div class="col-md-5">
-                        <input type="text" class="form-control" name="subcategory_path[]" placeholder="/subcategory-path">
-                    </div>
-                    <div class="col-md-1">
-                        <button type="button" class="btn btn-outline-danger" onclick="removeSubcategory(this)">
-                            <i class="fas fa-trash"></i>
-                        </button>
-                    </div>
-                `;
-                container.appendChild(div);
+                container.appendChild(subcategoryRowTemplate.content.cloneNode(true));
             }
             
             function removeSubcategory(button) {
@@ -3016,7 +2878,7 @@ def add_content_category():
         </script>
     </body>
     </html>
-    ''')
+    ''', sidebar_html=get_sidebar_html('content'))
 
 @app.route('/content/categories/edit/<int:category_id>', methods=['GET', 'POST'])
 @login_required
@@ -3033,13 +2895,12 @@ def edit_content_category(category_id):
             url_path = request.form.get('url_path')
             
             # Validate reserved paths
-            reserved_paths = ['/councillors', '/ktc-meetings', '/contact', '/admin', '/login']
-            if url_path in reserved_paths:
+            if url_path in RESERVED_CATEGORY_PATHS:
                 flash('This URL path is reserved and cannot be used.', 'error')
                 return redirect(request.url)
             
             # Check if URL path already exists (excluding current category)
-            existing = ContentCategory.query.filter(
+            existing = db.session.query(ContentCategory.id).filter(
                 ContentCategory.url_path == url_path,
                 ContentCategory.id != category_id
             ).first()
@@ -3050,78 +2911,25 @@ def edit_content_category(category_id):
             category.url_path = url_path
         
         db.session.commit()
+        invalidate_category_cache()
         flash('Category updated successfully!', 'success')
-        return redirect(url_for('content_categories'))
-    
-    return render_template_string('''
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Edit Category - Kesgrave CMS</title>
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
-    </head>
-    <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link active">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        return redirect(url_for('content_categories'))
+    
+    return render_cached_template('''
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Edit Category - Kesgrave CMS</title>
+        <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
+        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+        <link href="{{ admin_css_url }}" rel="stylesheet">
+    </head>
+    <body>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -3199,10 +3007,10 @@ def edit_content_category(category_id):
             </div>
         </div>
         
-        <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+        <script defer src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
     </body>
     </html>
-    ''', category=category)
+    ''', category=category, sidebar_html=get_sidebar_html('content'))
 
 @app.route('/content/categories/delete/<int:category_id>', methods=['POST'])
 @login_required
@@ -3213,19 +3021,31 @@ def delete_content_category(category_id):
     if category.is_predefined:
         return jsonify({'error': 'Cannot delete predefined categories'}), 400
     
-    # Check if category has pages
-    if category.pages:
+    # Check if category has pages - an EXISTS test, without loading the pages
+    has_pages = db.session.query(ContentPage.query.filter_by(category_id=category.id).exists()).scalar()
+    if has_pages:
         return jsonify({'error': 'Cannot delete category with existing pages'}), 400
     
-    # Delete subcategories first
-    for subcategory in category.subcategories:
-        db.session.delete(subcategory)
-    
-    db.session.delete(category)
+    # Delete subcategories first, then the category - one statement each, so
+    # the subcategories are never loaded just to be removed
+    ContentSubcategory.query.filter_by(category_id=category.id).delete(synchronize_session=False)
+    ContentCategory.query.filter_by(id=category.id).delete(synchronize_session=False)
     db.session.commit()
+    invalidate_category_cache()
     
     return jsonify({'success': True})
 
+# Slug building blocks, compiled once
+SLUG_STRIP_RE = re.compile(r'[^a-z0-9\s-]')
+SLUG_SPACE_RE = re.compile(r'\s+')
+
+# Tries at inserting a content page before giving up on finding a free slug
+SLUG_ATTEMPTS = 5
+
+def make_slug(title):
+    """URL slug for a page title: lower case letters, digits and hyphens"""
+    return SLUG_SPACE_RE.sub('-', SLUG_STRIP_RE.sub('', title.lower())).strip('-')
+
 # Content page creation and management
 @app.route('/content/add', methods=['GET', 'POST'])
 @login_required
@@ -3239,13 +3059,7 @@ def add_content_page():
         status = request.form.get('status', 'Draft')
         
         # Generate slug from title
-        slug = re.sub(r'[^a-zA-Z0-9\s-]', '', title.lower())
-        slug = re.sub(r'\s+', '-', slug).strip('-')
-        
-        # Check if slug already exists
-        existing = ContentPage.query.filter_by(slug=slug).first()
-        if existing:
-            slug = f"{slug}-{int(datetime.now().timestamp())}"
+        slug = make_slug(title)
         
         # Create content page
         content_page = ContentPage(
@@ -3256,33 +3070,14 @@ def add_content_page():
             category_id=category_id,
             subcategory_id=subcategory_id,
             status=status,
-            creation_date=datetime.utcnow()
+            # Date fields - a missing or invalid creation date falls back to now
+            creation_date=parse_form_date(request.form.get('created_date')) or datetime.utcnow(),
+            approval_date=parse_form_date(request.form.get('approved_date')),
+            next_review_date=parse_form_date(request.form.get('next_review_date'))
         )
         
-        # Handle date fields
-        created_date = request.form.get('created_date')
-        if created_date:
-            try:
-                content_page.creation_date = datetime.strptime(created_date, '%Y-%m-%d')
-            except ValueError:
-                pass  # Keep default if invalid date
-        
-        approved_date = request.form.get('approved_date')
-        if approved_date:
-            try:
-                content_page.approval_date = datetime.strptime(approved_date, '%Y-%m-%d')
-            except ValueError:
-                pass  # Keep None if invalid date
-        
-        next_review_date = request.form.get('next_review_date')
-        if next_review_date:
-            try:
-                content_page.next_review_date = datetime.strptime(next_review_date, '%Y-%m-%d')
-            except ValueError:
-                pass  # Keep None if invalid date
-        
-        db.session.add(content_page)
-        db.session.flush()  # Get the ID
+        # Save the uploads and build the child rows before touching the
+        # database, so the write transaction below stays short
         
         # Handle gallery images
         gallery_files = request.files.getlist('gallery_images[]')
@@ -3290,36 +3085,32 @@ def add_content_page():
         gallery_descriptions = request.form.getlist('gallery_description[]')
         gallery_alt_texts = request.form.getlist('gallery_alt_text[]')
         
-        for i, file in enumerate(gallery_files):
-            if file and file.filename:
-                filename = save_uploaded_file(file, 'content/images', 'image')
-                if filename:
-                    gallery_item = ContentGallery(
-                        content_page_id=content_page.id,
-                        filename=filename,
-                        title=gallery_titles[i] if i < len(gallery_titles) else '',
-                        description=gallery_descriptions[i] if i < len(gallery_descriptions) else '',
-                        alt_text=gallery_alt_texts[i] if i < len(gallery_alt_texts) else '',
-                        sort_order=i
-                    )
-                    db.session.add(gallery_item)
+        gallery_rows = []
+        for i, filename in enumerate(save_uploaded_files(gallery_files, 'content/images', 'image')):
+            if filename:
+                gallery_rows.append({
+                    'filename': filename,
+                    'title': gallery_titles[i] if i < len(gallery_titles) else '',
+                    'description': gallery_descriptions[i] if i < len(gallery_descriptions) else '',
+                    'alt_text': gallery_alt_texts[i] if i < len(gallery_alt_texts) else '',
+                    'sort_order': i
+                })
         
         # Handle related links
         link_titles = request.form.getlist('link_title[]')
         link_urls = request.form.getlist('link_url[]')
         
-        for i, title in enumerate(link_titles):
-            if title.strip() and i < len(link_urls) and link_urls[i].strip():
+        link_rows = []
+        for i, link_title in enumerate(link_titles):
+            if link_title.strip() and i < len(link_urls) and link_urls[i].strip():
                 # Check if the checkbox for this link is checked
                 new_tab_checked = request.form.get(f'link_new_tab_{i}') is not None
-                link = ContentLink(
-                    content_page_id=content_page.id,
-                    title=title.strip(),
-                    url=link_urls[i].strip(),
-                    new_tab=new_tab_checked,
-                    sort_order=i
-                )
-                db.session.add(link)
+                link_rows.append({
+                    'title': link_title.strip(),
+                    'url': link_urls[i].strip(),
+                    'new_tab': new_tab_checked,
+                    'sort_order': i
+                })
         
         # Handle downloads
         download_files = request.files.getlist('download_files[]')
@@ -3327,65 +3118,61 @@ def add_content_page():
         download_descriptions = request.form.getlist('download_description[]')
         download_alt_texts = request.form.getlist('download_alt_text[]')
         
-        for i, file in enumerate(download_files):
-            if file and file.filename:
-                filename = save_uploaded_file(file, 'content/downloads', 'download')
-                if filename:
-                    download_item = ContentDownload(
-                        content_page_id=content_page.id,
-                        filename=filename,
-                        title=download_titles[i] if i < len(download_titles) else file.filename,
-                        description=download_descriptions[i] if i < len(download_descriptions) else '',
-                        alt_text=download_alt_texts[i] if i < len(download_alt_texts) else '',
-                        sort_order=i
-                    )
-                    db.session.add(download_item)
+        download_rows = []
+        for i, filename in enumerate(save_uploaded_files(download_files, 'content/downloads', 'download')):
+            if filename:
+                download_rows.append({
+                    'filename': filename,
+                    'title': download_titles[i] if i < len(download_titles) else download_files[i].filename,
+                    'description': download_descriptions[i] if i < len(download_descriptions) else '',
+                    'alt_text': download_alt_texts[i] if i < len(download_alt_texts) else '',
+                    'sort_order': i
+                })
+        
+        # Insert straight away and let the unique slug column catch a clash,
+        # rather than looking the slug up first. Nothing else has been written
+        # in this transaction yet, so a clash can simply be rolled back and
+        # retried with a random suffix
+        for attempt in range(SLUG_ATTEMPTS):
+            db.session.add(content_page)
+            try:
+                db.session.flush()  # Get the ID
+                break
+            except IntegrityError as e:
+                db.session.rollback()
+                if 'slug' not in str(e.orig) or attempt == SLUG_ATTEMPTS - 1:
+                    raise
+                content_page.slug = f"{slug}-{uuid.uuid4().hex[:8]}"
+        
+        for model, rows in ((ContentGallery, gallery_rows), (ContentLink, link_rows), (ContentDownload, download_rows)):
+            if rows:
+                for row in rows:
+                    row['content_page_id'] = content_page.id
+                db.session.bulk_insert_mappings(model, rows)
         
         db.session.commit()
         flash('Content page created successfully!', 'success')
         return redirect(url_for('content_pages_list'))
     
-    # GET request - show form
-    categories = ContentCategory.query.filter_by(is_active=True).all()
-    return render_template_string('''
+    # GET request - show form; the cached category list carries each
+    # category's subcategories for the dropdown data
+    categories = get_active_categories()
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Add Content Page - Kesgrave CMS</title>
+        <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+        <link rel="preconnect" href="https://cdn.quilljs.com" crossorigin>
+        <link rel="preload" href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" as="style">
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <script src="https://cdn.quilljs.com/1.3.6/quill.min.js"></script>
-        <link href="https://cdn.quilljs.com/1.3.6/quill.snow.css" rel="stylesheet">
+        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet" media="print" onload="this.media='all'">
+        <noscript><link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet"></noscript>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
         <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
             .section-card {
                 border: none;
                 border-radius: 10px;
@@ -3395,35 +3182,7 @@ def add_content_page():
         </style>
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link active">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -3537,6 +3296,32 @@ def add_content_page():
                                 </div>
                             </div>
                         </div>
+                        <template id="galleryRowTemplate">
+                            <div class="row mb-3 gallery-item">
+                                <div class="col-md-3">
+                                    <label class="form-label">Image</label>
+                                    <input type="file" class="form-control" name="gallery_images[]" accept="image/*">
+                                </div>
+                                <div class="col-md-3">
+                                    <label class="form-label">Title</label>
+                                    <input type="text" class="form-control" name="gallery_title[]">
+                                </div>
+                                <div class="col-md-3">
+                                    <label class="form-label">Description</label>
+                                    <input type="text" class="form-control" name="gallery_description[]">
+                                </div>
+                                <div class="col-md-2">
+                                    <label class="form-label">Alt Text</label>
+                                    <input type="text" class="form-control" name="gallery_alt_text[]">
+                                </div>
+                                <div class="col-md-1">
+                                    <label class="form-label">&nbsp;</label>
+                                    <button type="button" class="btn btn-outline-danger d-block" onclick="removeGalleryItem(this)">
+                                        <i class="fas fa-trash"></i>
+                                    </button>
+                                </div>
+                            </div>
+                        </template>
                         <button type="button" class="btn btn-outline-primary btn-sm" onclick="addGalleryItem()">
                             <i class="fas fa-plus me-1"></i>Add Image
                         </button>
@@ -3574,6 +3359,31 @@ def add_content_page():
                                 </div>
                             </div>
                         </div>
+                        <template id="linkRowTemplate">
+                            <div class="row mb-3 link-item">
+                                <div class="col-md-4">
+                                    <label class="form-label">Title</label>
+                                    <input type="text" class="form-control" name="link_title[]">
+                                </div>
+                                <div class="col-md-5">
+                                    <label class="form-label">URL</label>
+                                    <input type="url" class="form-control" name="link_url[]">
+                                </div>
+                                <div class="col-md-2">
+                                    <label class="form-label">New Tab</label>
+                                    <div class="form-check">
+                                        <input type="checkbox" class="form-check-input" name="link_new_tab_" checked>
+                                        <label class="form-check-label">Open in new tab</label>
+                                    </div>
+                                </div>
+                                <div class="col-md-1">
+                                    <label class="form-label">&nbsp;</label>
+                                    <button type="button" class="btn btn-outline-danger d-block" onclick="removeLinkItem(this)">
+                                        <i class="fas fa-trash"></i>
+                                    </button>
+                                </div>
+                            </div>
+                        </template>
                         <button type="button" class="btn btn-outline-primary btn-sm" onclick="addLinkItem()">
                             <i class="fas fa-plus me-1"></i>Add Link
                         </button>
@@ -3612,6 +3422,32 @@ def add_content_page():
                                 </div>
                             </div>
                         </div>
+                        <template id="downloadRowTemplate">
+                            <div class="row mb-3 download-item">
+                                <div class="col-md-3">
+                                    <label class="form-label">File</label>
+                                    <input type="file" class="form-control" name="download_files[]">
+                                </div>
+                                <div class="col-md-3">
+                                    <label class="form-label">Title</label>
+                                    <input type="text" class="form-control" name="download_title[]">
+                                </div>
+                                <div class="col-md-3">
+                                    <label class="form-label">Description</label>
+                                    <input type="text" class="form-control" name="download_description[]">
+                                </div>
+                                <div class="col-md-2">
+                                    <label class="form-label">Alt Text</label>
+                                    <input type="text" class="form-control" name="download_alt_text[]">
+                                </div>
+                                <div class="col-md-1">
+                                    <label class="form-label">&nbsp;</label>
+                                    <button type="button" class="btn btn-outline-danger d-block" onclick="removeDownloadItem(this)">
+                                        <i class="fas fa-trash"></i>
+                                    </button>
+                                </div>
+                            </div>
+                        </template>
                         <button type="button" class="btn btn-outline-primary btn-sm" onclick="addDownloadItem()">
                             <i class="fas fa-plus me-1"></i>Add Download
                         </button>
@@ -3662,44 +3498,99 @@ def add_content_page():
             </form>
         </div>
         
-        <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+        <script defer src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
         <script>
-            // Initialize Quill.js
-            var quill = new Quill('#longDescription', {
-                theme: 'snow',
-                modules: {
-                    toolbar: [
-                        [{ 'header': [1, 2, 3, false] }],
-                        ['bold', 'italic', 'underline', 'strike'],
-                        [{ 'list': 'ordered'}, { 'list': 'bullet' }],
-                        [{ 'indent': '-1'}, { 'indent': '+1' }],
-                        ['link', 'image'],
-                        [{ 'align': [] }],
-                        ['clean']
-                    ]
-                }
-            });
+            // Quill.js is only fetched once the editor scrolls near the viewport,
+            // so the rest of the form renders without waiting on the library
+            var quill = null;
+            
+            function loadScript(src) {
+                return new Promise(function(resolve, reject) {
+                    const script = document.createElement('script');
+                    script.src = src;
+                    script.onload = resolve;
+                    script.onerror = reject;
+                    document.head.appendChild(script);
+                });
+            }
             
-            // Update hidden input when content changes
-            quill.on('text-change', function() {
-                document.getElementById('longDescriptionInput').value = quill.root.innerHTML;
-            });
+            function loadStylesheet(href) {
+                return new Promise(function(resolve, reject) {
+                    const link = document.createElement('link');
+                    link.rel = 'stylesheet';
+                    link.href = href;
+                    link.onload = resolve;
+                    link.onerror = reject;
+                    document.head.appendChild(link);
+                });
+            }
+            
+            function initQuill() {
+                quill = new Quill('#longDescription', {
+                    theme: 'snow',
+                    modules: {
+                        toolbar: [
+                            [{ 'header': [1, 2, 3, false] }],
+                            ['bold', 'italic', 'underline', 'strike'],
+                            [{ 'list': 'ordered'}, { 'list': 'bullet' }],
+                            [{ 'indent': '-1'}, { 'indent': '+1' }],
+                            ['link', 'image'],
+                            [{ 'align': [] }],
+                            ['clean']
+                        ]
+                    }
+                });
+                
+                // Upload images picked from the toolbar and embed their URL,
+                // rather than inlining the file into the page HTML as base64
+                quill.getModule('toolbar').addHandler('image', function() {
+                    const input = document.createElement('input');
+                    input.type = 'file';
+                    input.accept = 'image/*';
+                    input.onchange = function() {
+                        const formData = new FormData();
+                        formData.append('file', input.files[0]);
+                        fetch('/upload/inline-image', {
+                            method: 'POST',
+                            body: formData
+                        }).then(response => {
+                            if (!response.ok) {
+                                throw new Error('Upload failed');
+                            }
+                            return response.json();
+                        }).then(data => {
+                            const range = quill.getSelection(true);
+                            quill.insertEmbed(range.index, 'image', data.url);
+                        }).catch(() => {
+                            alert('Error uploading image');
+                        });
+                    };
+                    input.click();
+                });
+            }
+            
+            const quillObserver = new IntersectionObserver(function(entries) {
+                if (entries[0].isIntersecting) {
+                    quillObserver.disconnect();
+                    Promise.all([
+                        loadStylesheet('https://cdn.quilljs.com/1.3.6/quill.snow.css'),
+                        loadScript('https://cdn.quilljs.com/1.3.6/quill.min.js')
+                    ]).then(initQuill);
+                }
+            }, { rootMargin: '200px' });
+            quillObserver.observe(document.getElementById('longDescription'));
             
-            // Update hidden input before form submission
+            // The hidden input is only read on submit, so copy the editor HTML
+            // into it then rather than on every keystroke; if the editor was
+            // never loaded the hidden input still holds the original content
             document.querySelector('form').addEventListener('submit', function() {
-                document.getElementById('longDescriptionInput').value = quill.root.innerHTML;
+                if (quill) {
+                    document.getElementById('longDescriptionInput').value = quill.root.innerHTML;
+                }
             });
             
             // Category/Subcategory handling
-            const subcategoriesData = {
-                {% for category in categories %}
-                {{ category.id }}: [
-                    {% for subcategory in category.subcategories %}
-                    {id: {{ subcategory.id }}, name: "{{ subcategory.name }}"}{{ "," if not loop.last }}
-                    {% endfor %}
-                ]{{ "," if not loop.last }}
-                {% endfor %}
-            };
+            const subcategoriesData = {{ subcategories_json }};
             
             function loadSubcategories() {
                 const categoryId = document.getElementById('categorySelect').value;
@@ -3717,36 +3608,24 @@ def add_content_page():
                 }
             }
             
+            // Clone rows from a <template> into one fragment and insert them
+            // with a single append, so adding several rows costs one reflow
+            function appendRows(containerId, template, count, prepareRow) {
+                const rows = document.createDocumentFragment();
+                for (let i = 0; i < count; i++) {
+                    const row = template.content.cloneNode(true);
+                    if (prepareRow) {
+                        prepareRow(row);
+                    }
+                    rows.appendChild(row);
+                }
+                document.getElementById(containerId).appendChild(rows);
+            }
+            
             // Gallery management
-            function addGalleryItem() {
-                const container = document.getElementById('galleryContainer');
-                const div = document.createElement('div');
-                div.className = 'row mb-3 gallery-item';
-                div.innerHTML = `
-                    <div class="col-md-3">
-                        <label class="form-label">Image</label>
-                        <input type="file" class="form-control" name="gallery_images[]" accept="image/*">
-                    </div>
-                    <div class="col-md-3">
-                        <label class="form-label">Title</label>
-                        <input type="text" class="form-control" name="gallery_title[]">
-                    </div>
-                    <div class="col-md-3">
-                        <label class="form-label">Description</label>
-                        <input type="text" class="form-control" name="gallery_description[]">
-                    </div>
-                    <div class="col-md-2">
-                        <label class="form-label">Alt Text</label>
-                        <input type="text" class="form-control" name="gallery_alt_text[]">
-                    </div>
-                    <div class="col-md-1">
-                        <label class="form-label">&nbsp;</label>
-                        <button type="button" class="btn btn-outline-danger d-block" onclick="removeGalleryItem(this)">
-                            <i class="fas fa-trash"></i>
-                        </button>
-                    </div>
-                `;
-                container.appendChild(div);
+            const galleryRowTemplate = document.getElementById('galleryRowTemplate');
+            function addGalleryItem(count = 1) {
+                appendRows('galleryContainer', galleryRowTemplate, count);
             }
             
             function removeGalleryItem(button) {
@@ -3755,35 +3634,12 @@ def add_content_page():
             
             // Links management
             let linkCounter = 1;
-            function addLinkItem() {
-                const container = document.getElementById('linksContainer');
-                const div = document.createElement('div');
-                div.className = 'row mb-3 link-item';
-                div.innerHTML = `
-                    <div class="col-md-4">
-                        <label class="form-label">Title</label>
-                        <input type="text" class="form-control" name="link_title[]">
-                    </div>
-                    <div class="col-md-5">
-                        <label class="form-label">URL</label>
-                        <input type="url" class="form-control" name="link_url[]">
-                    </div>
-                    <div class="col-md-2">
-                        <label class="form-label">New Tab</label>
-                        <div class="form-check">
-                            <input type="checkbox" class="form-check-input" name="link_new_tab_${linkCounter}" checked>
-                            <label class="form-check-label">Open in new tab</label>
-                        </div>
-                    </div>
-                    <div class="col-md-1">
-                        <label class="form-label">&nbsp;</label>
-                        <button type="button" class="btn btn-outline-danger d-block" onclick="removeLinkItem(this)">
-                            <i class="fas fa-trash"></i>
-                        </button>
-                    </div>
-                `;
-                container.appendChild(div);
-                linkCounter++;
+            const linkRowTemplate = document.getElementById('linkRowTemplate');
+            function addLinkItem(count = 1) {
+                appendRows('linksContainer', linkRowTemplate, count, function(row) {
+                    row.querySelector('input[type=checkbox]').name = 'link_new_tab_' + linkCounter;
+                    linkCounter++;
+                });
             }
             
             function removeLinkItem(button) {
@@ -3791,35 +3647,9 @@ def add_content_page():
             }
             
             // Downloads management
-            function addDownloadItem() {
-                const container = document.getElementById('downloadsContainer');
-                const div = document.createElement('div');
-                div.className = 'row mb-3 download-item';
-                div.innerHTML = `
-                    <div class="col-md-3">
-                        <label class="form-label">File</label>
-                        <input type="file" class="form-control" name="download_files[]">
-                    </div>
-                    <div class="col-md-3">
-                        <label class="form-label">Title</label>
-                        <input type="text" class="form-control" name="download_title[]">
-                    </div>
-                    <div class="col-md-3">
-                        <label class="form-label">Description</label>
-                        <input type="text" class="form-control" name="download_description[]">
-                    </div>
-                    <div class="col-md-2">
-                        <label class="form-label">Alt Text</label>
-                        <input type="text" class="form-control" name="download_alt_text[]">
-                    </div>
-                    <div class="col-md-1">
-                        <label class="form-label">&nbsp;</label>
-                        <button type="button" class="btn btn-outline-danger d-block" onclick="removeDownloadItem(this)">
-                            <i class="fas fa-trash"></i>
-                        </button>
-                    </div>
-                `;
-                container.appendChild(div);
+            const downloadRowTemplate = document.getElementById('downloadRowTemplate');
+            function addDownloadItem(count = 1) {
+                appendRows('downloadsContainer', downloadRowTemplate, count);
             }
             
             function removeDownloadItem(button) {
@@ -3828,7 +3658,7 @@ def add_content_page():
         </script>
     </body>
     </html>
-    ''', categories=categories)
+    ''', categories=categories, subcategories_json=get_subcategories_json(), sidebar_html=get_sidebar_html('content'))
 
 @app.route('/content/edit/<int:page_id>', methods=['GET', 'POST'])
 @login_required
@@ -3836,244 +3666,193 @@ def edit_content_page(page_id):
     page = ContentPage.query.get_or_404(page_id)
     
     if request.method == 'POST':
-        # Update basic information
-        page.title = request.form.get('title')
-        page.status = request.form.get('status')
-        page.category_id = request.form.get('category_id')
-        page.subcategory_id = request.form.get('subcategory_id') if request.form.get('subcategory_id') else None
-        page.short_description = request.form.get('short_description')
-        page.long_description = request.form.get('long_description')
-        
-        # Handle date fields
-        created_date = request.form.get('created_date')
-        if created_date:
-            try:
-                page.creation_date = datetime.strptime(created_date, '%Y-%m-%d')
-            except ValueError:
-                pass  # Keep existing if invalid date
-        
+        # Update basic information and dates - an invalid date keeps the
+        # existing value, while clearing the approval or review date removes it
         approved_date = request.form.get('approved_date')
-        if approved_date:
-            try:
-                page.approval_date = datetime.strptime(approved_date, '%Y-%m-%d')
-            except ValueError:
-                pass  # Keep existing if invalid date
-        else:
-            page.approval_date = None
-        
         next_review_date = request.form.get('next_review_date')
-        if next_review_date:
-            try:
-                page.next_review_date = datetime.strptime(next_review_date, '%Y-%m-%d')
-            except ValueError:
-                pass  # Keep existing if invalid date
-        else:
-            page.next_review_date = None
-        
-        # Handle gallery updates
-        existing_gallery_ids = request.form.getlist('existing_gallery_ids[]')
-        gallery_files = request.files.getlist('gallery_files[]')
-        gallery_titles = request.form.getlist('gallery_title[]')
-        gallery_descriptions = request.form.getlist('gallery_description[]')
-        gallery_alt_texts = request.form.getlist('gallery_alt_text[]')
-        
-        # Remove gallery items not in the form (deleted items)
-        current_gallery_ids = [str(item.id) for item in page.gallery_images]
-        for gallery_id in current_gallery_ids:
-            if gallery_id not in existing_gallery_ids:
-                gallery_item = ContentGallery.query.get(gallery_id)
-                if gallery_item:
-                    db.session.delete(gallery_item)
-        
-        # Update existing and add new gallery items
-        for i, title in enumerate(gallery_titles):
-            if i < len(existing_gallery_ids) and existing_gallery_ids[i]:
-                # Update existing gallery item
-                gallery_item = ContentGallery.query.get(existing_gallery_ids[i])
-                if gallery_item:
-                    gallery_item.title = title.strip() if title else None
-                    gallery_item.description = gallery_descriptions[i].strip() if i < len(gallery_descriptions) and gallery_descriptions[i] else None
-                    gallery_item.alt_text = gallery_alt_texts[i].strip() if i < len(gallery_alt_texts) and gallery_alt_texts[i] else None
+        new_values = {
+            'title': request.form.get('title'),
+            'status': request.form.get('status'),
+            'category_id': request.form.get('category_id', type=int),
+            'subcategory_id': request.form.get('subcategory_id', type=int),
+            'short_description': request.form.get('short_description'),
+            'long_description': request.form.get('long_description'),
+            'creation_date': parse_form_date(request.form.get('created_date')) or page.creation_date,
+            'approval_date': (parse_form_date(approved_date) or page.approval_date) if approved_date else None,
+            'next_review_date': (parse_form_date(next_review_date) or page.next_review_date) if next_review_date else None,
+        }
+        # Only the fields that actually changed go into the page's UPDATE
+        page_changes = {field: value for field, value in new_values.items() if getattr(page, field) != value}
+        
+        with db.session.no_autoflush:
+            # Handle gallery updates
+            existing_gallery_ids = request.form.getlist('existing_gallery_ids[]')
+            gallery_files = request.files.getlist('gallery_files[]')
+            gallery_titles = request.form.getlist('gallery_title[]')
+            gallery_descriptions = request.form.getlist('gallery_description[]')
+            gallery_alt_texts = request.form.getlist('gallery_alt_text[]')
+        
+            # Remove gallery items not in the form (deleted items)
+            current_gallery_ids = [str(item.id) for item in page.gallery_images]
+            for gallery_id in current_gallery_ids:
+                if gallery_id not in existing_gallery_ids:
+                    gallery_item = ContentGallery.query.get(gallery_id)
+                    if gallery_item:
+                        db.session.delete(gallery_item)
+        
+            # Update existing and add new gallery items
+            new_gallery_rows = []
+            for i, title in enumerate(gallery_titles):
+                if i < len(existing_gallery_ids) and existing_gallery_ids[i]:
+                    # Update existing gallery item
+                    gallery_item = ContentGallery.query.get(existing_gallery_ids[i])
+                    if gallery_item:
+                        gallery_item.title = title.strip() if title else None
+                        gallery_item.description = gallery_descriptions[i].strip() if i < len(gallery_descriptions) and gallery_descriptions[i] else None
+                        gallery_item.alt_text = gallery_alt_texts[i].strip() if i < len(gallery_alt_texts) and gallery_alt_texts[i] else None
                     
-                    # Update file if new one uploaded
+                        # Update file if new one uploaded
+                        if i < len(gallery_files) and gallery_files[i] and gallery_files[i].filename:
+                            filename = save_uploaded_file(gallery_files[i], 'content/images', 'gallery')
+                            if filename:
+                                gallery_item.filename = filename
+                else:
+                    # Add new gallery item
                     if i < len(gallery_files) and gallery_files[i] and gallery_files[i].filename:
                         filename = save_uploaded_file(gallery_files[i], 'content/images', 'gallery')
                         if filename:
-                            gallery_item.filename = filename
-            else:
-                # Add new gallery item
-                if i < len(gallery_files) and gallery_files[i] and gallery_files[i].filename:
-                    filename = save_uploaded_file(gallery_files[i], 'content/images', 'gallery')
-                    if filename:
-                        gallery_item = ContentGallery(
-                            content_page_id=page.id,
-                            filename=filename,
-                            title=title.strip() if title else None,
-                            description=gallery_descriptions[i].strip() if i < len(gallery_descriptions) and gallery_descriptions[i] else None,
-                            alt_text=gallery_alt_texts[i].strip() if i < len(gallery_alt_texts) and gallery_alt_texts[i] else None
-                        )
-                        db.session.add(gallery_item)
-        
-        # Handle links updates
-        existing_link_ids = request.form.getlist('existing_link_ids[]')
-        link_titles = request.form.getlist('link_title[]')
-        link_urls = request.form.getlist('link_url[]')
-        
-        # Remove links not in the form (deleted items)
-        current_link_ids = [str(link.id) for link in page.related_links]
-        for link_id in current_link_ids:
-            if link_id not in existing_link_ids:
-                link_item = ContentLink.query.get(link_id)
-                if link_item:
-                    db.session.delete(link_item)
-        
-        # Update existing and add new links
-        for i, title in enumerate(link_titles):
-            if title.strip() and i < len(link_urls) and link_urls[i].strip():
-                new_tab_checked = request.form.get(f'link_new_tab_{i}') is not None
-                
-                if i < len(existing_link_ids) and existing_link_ids[i]:
-                    # Update existing link
-                    link_item = ContentLink.query.get(existing_link_ids[i])
+                            new_gallery_rows.append({
+                                'content_page_id': page.id,
+                                'filename': filename,
+                                'title': title.strip() if title else None,
+                                'description': gallery_descriptions[i].strip() if i < len(gallery_descriptions) and gallery_descriptions[i] else None,
+                                'alt_text': gallery_alt_texts[i].strip() if i < len(gallery_alt_texts) and gallery_alt_texts[i] else None
+                            })
+            if new_gallery_rows:
+                db.session.bulk_insert_mappings(ContentGallery, new_gallery_rows)
+        
+            # Handle links updates
+            existing_link_ids = request.form.getlist('existing_link_ids[]')
+            link_titles = request.form.getlist('link_title[]')
+            link_urls = request.form.getlist('link_url[]')
+        
+            # Remove links not in the form (deleted items)
+            current_link_ids = [str(link.id) for link in page.related_links]
+            for link_id in current_link_ids:
+                if link_id not in existing_link_ids:
+                    link_item = ContentLink.query.get(link_id)
                     if link_item:
-                        link_item.title = title.strip()
-                        link_item.url = link_urls[i].strip()
-                        link_item.new_tab = new_tab_checked
-                        link_item.sort_order = i
-                else:
-                    # Add new link
-                    link_item = ContentLink(
-                        content_page_id=page.id,
-                        title=title.strip(),
-                        url=link_urls[i].strip(),
-                        new_tab=new_tab_checked,
-                        sort_order=i
-                    )
-                    db.session.add(link_item)
+                        db.session.delete(link_item)
         
-        # Handle downloads updates
-        existing_download_ids = request.form.getlist('existing_download_ids[]')
-        download_files = request.files.getlist('download_files[]')
-        download_titles = request.form.getlist('download_title[]')
-        download_descriptions = request.form.getlist('download_description[]')
-        
-        # Remove downloads not in the form (deleted items)
-        current_download_ids = [str(download.id) for download in page.downloads]
-        for download_id in current_download_ids:
-            if download_id not in existing_download_ids:
-                download_item = ContentDownload.query.get(download_id)
-                if download_item:
-                    db.session.delete(download_item)
-        
-        # Update existing and add new downloads
-        for i, title in enumerate(download_titles):
-            if title.strip():
-                if i < len(existing_download_ids) and existing_download_ids[i]:
-                    # Update existing download
-                    download_item = ContentDownload.query.get(existing_download_ids[i])
+            # Update existing and add new links
+            new_link_rows = []
+            for i, title in enumerate(link_titles):
+                if title.strip() and i < len(link_urls) and link_urls[i].strip():
+                    new_tab_checked = request.form.get(f'link_new_tab_{i}') is not None
+                
+                    if i < len(existing_link_ids) and existing_link_ids[i]:
+                        # Update existing link
+                        link_item = ContentLink.query.get(existing_link_ids[i])
+                        if link_item:
+                            link_item.title = title.strip()
+                            link_item.url = link_urls[i].strip()
+                            link_item.new_tab = new_tab_checked
+                            link_item.sort_order = i
+                    else:
+                        # Add new link
+                        new_link_rows.append({
+                            'content_page_id': page.id,
+                            'title': title.strip(),
+                            'url': link_urls[i].strip(),
+                            'new_tab': new_tab_checked,
+                            'sort_order': i
+                        })
+            if new_link_rows:
+                db.session.bulk_insert_mappings(ContentLink, new_link_rows)
+        
+            # Handle downloads updates
+            existing_download_ids = request.form.getlist('existing_download_ids[]')
+            download_files = request.files.getlist('download_files[]')
+            download_titles = request.form.getlist('download_title[]')
+            download_descriptions = request.form.getlist('download_description[]')
+        
+            # Remove downloads not in the form (deleted items)
+            current_download_ids = [str(download.id) for download in page.downloads]
+            for download_id in current_download_ids:
+                if download_id not in existing_download_ids:
+                    download_item = ContentDownload.query.get(download_id)
                     if download_item:
-                        download_item.title = title.strip()
-                        download_item.description = download_descriptions[i].strip() if i < len(download_descriptions) and download_descriptions[i] else None
+                        db.session.delete(download_item)
+        
+            # Update existing and add new downloads
+            new_download_rows = []
+            for i, title in enumerate(download_titles):
+                if title.strip():
+                    if i < len(existing_download_ids) and existing_download_ids[i]:
+                        # Update existing download
+                        download_item = ContentDownload.query.get(existing_download_ids[i])
+                        if download_item:
+                            download_item.title = title.strip()
+                            download_item.description = download_descriptions[i].strip() if i < len(download_descriptions) and download_descriptions[i] else None
                         
-                        # Update file if new one uploaded
+                            # Update file if new one uploaded
+                            if i < len(download_files) and download_files[i] and download_files[i].filename:
+                                filename = save_uploaded_file(download_files[i], 'content/downloads', 'download')
+                                if filename:
+                                    download_item.filename = filename
+                    else:
+                        # Add new download
                         if i < len(download_files) and download_files[i] and download_files[i].filename:
                             filename = save_uploaded_file(download_files[i], 'content/downloads', 'download')
                             if filename:
-                                download_item.filename = filename
-                else:
-                    # Add new download
-                    if i < len(download_files) and download_files[i] and download_files[i].filename:
-                        filename = save_uploaded_file(download_files[i], 'content/downloads', 'download')
-                        if filename:
-                            download_item = ContentDownload(
-                                content_page_id=page.id,
-                                filename=filename,
-                                title=title.strip(),
-                                description=download_descriptions[i].strip() if i < len(download_descriptions) and download_descriptions[i] else None
-                            )
-                            db.session.add(download_item)
-        
-        # Set updated timestamp
-        page.updated_at = datetime.utcnow()
-        
-        db.session.commit()
+                                new_download_rows.append({
+                                    'content_page_id': page.id,
+                                    'filename': filename,
+                                    'title': title.strip(),
+                                    'description': download_descriptions[i].strip() if i < len(download_descriptions) and download_descriptions[i] else None
+                                })
+            if new_download_rows:
+                db.session.bulk_insert_mappings(ContentDownload, new_download_rows)
+        
+            # Only write (and bump updated_at) when the page or its gallery, links
+            # or downloads changed - saving an untouched form costs no UPDATE.
+            # Autoflush stays off until then so pending changes are still visible
+            if (page_changes or new_gallery_rows or new_link_rows or new_download_rows or db.session.deleted
+                    or any(db.session.is_modified(obj) for obj in db.session.dirty)):
+                # The page row itself is written with a single Core UPDATE of
+                # the changed columns rather than through ORM attribute tracking
+                db.session.execute(
+                    update(ContentPage)
+                    .where(ContentPage.id == page.id)
+                    .values(**page_changes, updated_at=datetime.utcnow())
+                )
+                db.session.commit()
         flash('Content page updated successfully!', 'success')
         return redirect(url_for('content_pages_list'))
     
-    # GET request - show form with existing data
-    categories = ContentCategory.query.filter_by(is_active=True).all()
+    # GET request - show form with existing data; the cached category list
+    # carries each category's subcategories, so the dropdown data needs no
+    # per-category lazy loads
+    categories = get_active_categories()
     
-    return render_template_string('''
+    return render_cached_template('''
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Edit Content Page - Kesgrave CMS</title>
+        <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+        <link rel="preconnect" href="https://cdn.quilljs.com" crossorigin>
+        <link rel="preload" href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" as="style">
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-        <script src="https://cdn.quilljs.com/1.3.6/quill.min.js"></script>
-        <link href="https://cdn.quilljs.com/1.3.6/quill.snow.css" rel="stylesheet">
-        <style>
-            .sidebar {
-                position: fixed;
-                top: 0;
-                left: 0;
-                height: 100vh;
-                width: 260px;
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-                color: white;
-                z-index: 1000;
-            }
-            .main-content {
-                margin-left: 260px;
-                padding: 2rem;
-                background-color: #f8f9fa;
-                min-height: 100vh;
-            }
-            .nav-link {
-                color: rgba(255,255,255,0.8);
-                padding: 0.75rem 1.5rem;
-                display: block;
-                text-decoration: none;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover, .nav-link.active {
-                color: white;
-                background: rgba(255,255,255,0.1);
-            }
-        </style>
+        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet" media="print" onload="this.media='all'">
+        <noscript><link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet"></noscript>
+        <link href="{{ admin_css_url }}" rel="stylesheet">
     </head>
     <body>
-        <nav class="sidebar">
-            <div class="p-3 text-center border-bottom">
-                <h4>🏛️ Kesgrave CMS</h4>
-            </div>
-            <div class="p-3">
-                <a href="/dashboard" class="nav-link">
-                    <i class="fas fa-tachometer-alt me-2"></i>Dashboard
-                </a>
-                <a href="/councillors" class="nav-link">
-                    <i class="fas fa-users me-2"></i>Councillors
-                </a>
-                <a href="/tags" class="nav-link">
-                    <i class="fas fa-tags me-2"></i>Ward Tags
-                </a>
-                <a href="/content" class="nav-link active">
-                    <i class="fas fa-file-alt me-2"></i>Content
-                </a>
-                <a href="/events" class="nav-link">
-                    <i class="fas fa-calendar me-2"></i>Events
-                </a>
-                <a href="/settings" class="nav-link">
-                    <i class="fas fa-cog me-2"></i>Settings
-                </a>
-                <hr style="border-color: rgba(255,255,255,0.2);">
-                <a href="/logout" class="nav-link">
-                    <i class="fas fa-sign-out-alt me-2"></i>Logout
-                </a>
-            </div>
-        </nav>
+        {{ sidebar_html|safe }}
         
         <div class="main-content">
             <div class="d-flex justify-content-between align-items-center mb-4">
@@ -4239,6 +4018,34 @@ def edit_content_page(page_id):
                             </div>
                             {% endfor %}
                         </div>
+                        <template id="galleryRowTemplate">
+                            <div class="gallery-item border rounded p-3 mb-3">
+                                <div class="row">
+                                    <div class="col-md-3">
+                                        <label class="form-label">Image</label>
+                                        <input type="file" class="form-control" name="gallery_files[]" accept="image/*" required>
+                                    </div>
+                                    <div class="col-md-3">
+                                        <label class="form-label">Title</label>
+                                        <input type="text" class="form-control" name="gallery_title[]">
+                                    </div>
+                                    <div class="col-md-3">
+                                        <label class="form-label">Description</label>
+                                        <textarea class="form-control" name="gallery_description[]" rows="2"></textarea>
+                                    </div>
+                                    <div class="col-md-2">
+                                        <label class="form-label">Alt Text</label>
+                                        <input type="text" class="form-control" name="gallery_alt_text[]">
+                                    </div>
+                                    <div class="col-md-1">
+                                        <label class="form-label">&nbsp;</label>
+                                        <button type="button" class="btn btn-outline-danger d-block" onclick="removeGalleryItem(this)">
+                                            <i class="fas fa-trash"></i>
+                                        </button>
+                                    </div>
+                                </div>
+                            </div>
+                        </template>
                         <button type="button" class="btn btn-outline-primary" onclick="addGalleryItem()">
                             <i class="fas fa-plus me-2"></i>Add Gallery Item
                         </button>
@@ -4281,6 +4088,33 @@ def edit_content_page(page_id):
                             </div>
                             {% endfor %}
                         </div>
+                        <template id="linkRowTemplate">
+                            <div class="link-item border rounded p-3 mb-3">
+                                <div class="row">
+                                    <div class="col-md-4">
+                                        <label class="form-label">Link Title</label>
+                                        <input type="text" class="form-control" name="link_title[]" required>
+                                    </div>
+                                    <div class="col-md-4">
+                                        <label class="form-label">URL</label>
+                                        <input type="url" class="form-control" name="link_url[]" required>
+                                    </div>
+                                    <div class="col-md-2">
+                                        <label class="form-label">Open in New Tab</label>
+                                        <div class="form-check">
+                                            <input type="checkbox" class="form-check-input" name="link_new_tab_">
+                                            <label class="form-check-label">New Tab</label>
+                                        </div>
+                                    </div>
+                                    <div class="col-md-2">
+                                        <label class="form-label">&nbsp;</label>
+                                        <button type="button" class="btn btn-outline-danger d-block" onclick="removeLinkItem(this)">
+                                            <i class="fas fa-trash"></i>
+                                        </button>
+                                    </div>
+                                </div>
+                            </div>
+                        </template>
                         <button type="button" class="btn btn-outline-primary" onclick="addLinkItem()">
                             <i class="fas fa-plus me-2"></i>Add Related Link
                         </button>
@@ -4327,6 +4161,30 @@ def edit_content_page(page_id):
                             </div>
                             {% endfor %}
                         </div>
+                        <template id="downloadRowTemplate">
+                            <div class="download-item border rounded p-3 mb-3">
+                                <div class="row">
+                                    <div class="col-md-3">
+                                        <label class="form-label">File</label>
+                                        <input type="file" class="form-control" name="download_files[]" required>
+                                    </div>
+                                    <div class="col-md-3">
+                                        <label class="form-label">Title</label>
+                                        <input type="text" class="form-control" name="download_title[]" required>
+                                    </div>
+                                    <div class="col-md-4">
+                                        <label class="form-label">Description</label>
+                                        <textarea class="form-control" name="download_description[]" rows="2"></textarea>
+                                    </div>
+                                    <div class="col-md-1">
+                                        <label class="form-label">&nbsp;</label>
+                                        <button type="button" class="btn btn-outline-danger d-block" onclick="removeDownloadItem(this)">
+                                            <i class="fas fa-trash"></i>
+                                        </button>
+                                    </div>
+                                </div>
+                            </div>
+                        </template>
                         <button type="button" class="btn btn-outline-primary" onclick="addDownloadItem()">
                             <i class="fas fa-plus me-2"></i>Add Download
                         </button>
@@ -4342,50 +4200,105 @@ def edit_content_page(page_id):
             </form>
         </div>
         
-        <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+        <script defer src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
         <script>
-            // Initialize Quill.js with existing content
-            var quill = new Quill('#longDescription', {
-                theme: 'snow',
-                modules: {
-                    toolbar: [
-                        [{ 'header': [1, 2, 3, false] }],
-                        ['bold', 'italic', 'underline', 'strike'],
-                        [{ 'list': 'ordered'}, { 'list': 'bullet' }],
-                        [{ 'indent': '-1'}, { 'indent': '+1' }],
-                        ['link', 'image'],
-                        [{ 'align': [] }],
-                        ['clean']
-                    ]
-                }
-            });
+            // Quill.js is only fetched once the editor scrolls near the viewport,
+            // so the rest of the form renders without waiting on the library
+            var quill = null;
+            
+            function loadScript(src) {
+                return new Promise(function(resolve, reject) {
+                    const script = document.createElement('script');
+                    script.src = src;
+                    script.onload = resolve;
+                    script.onerror = reject;
+                    document.head.appendChild(script);
+                });
+            }
             
-            // Set existing content
-            var existingContent = document.getElementById('longDescriptionInput').value;
-            if (existingContent) {
-                quill.root.innerHTML = existingContent;
+            function loadStylesheet(href) {
+                return new Promise(function(resolve, reject) {
+                    const link = document.createElement('link');
+                    link.rel = 'stylesheet';
+                    link.href = href;
+                    link.onload = resolve;
+                    link.onerror = reject;
+                    document.head.appendChild(link);
+                });
             }
             
-            // Update hidden input when content changes
-            quill.on('text-change', function() {
-                document.getElementById('longDescriptionInput').value = quill.root.innerHTML;
-            });
+            function initQuill() {
+                quill = new Quill('#longDescription', {
+                    theme: 'snow',
+                    modules: {
+                        toolbar: [
+                            [{ 'header': [1, 2, 3, false] }],
+                            ['bold', 'italic', 'underline', 'strike'],
+                            [{ 'list': 'ordered'}, { 'list': 'bullet' }],
+                            [{ 'indent': '-1'}, { 'indent': '+1' }],
+                            ['link', 'image'],
+                            [{ 'align': [] }],
+                            ['clean']
+                        ]
+                    }
+                });
+                
+                // Set existing content
+                var existingContent = document.getElementById('longDescriptionInput').value;
+                if (existingContent) {
+                    quill.root.innerHTML = existingContent;
+                }
+                
+                // Upload images picked from the toolbar and embed their URL,
+                // rather than inlining the file into the page HTML as base64
+                quill.getModule('toolbar').addHandler('image', function() {
+                    const input = document.createElement('input');
+                    input.type = 'file';
+                    input.accept = 'image/*';
+                    input.onchange = function() {
+                        const formData = new FormData();
+                        formData.append('file', input.files[0]);
+                        fetch('/upload/inline-image', {
+                            method: 'POST',
+                            body: formData
+                        }).then(response => {
+                            if (!response.ok) {
+                                throw new Error('Upload failed');
+                            }
+                            return response.json();
+                        }).then(data => {
+                            const range = quill.getSelection(true);
+                            quill.insertEmbed(range.index, 'image', data.url);
+                        }).catch(() => {
+                            alert('Error uploading image');
+                        });
+                    };
+                    input.click();
+                });
+            }
             
-            // Update hidden input before form submission
+            const quillObserver = new IntersectionObserver(function(entries) {
+                if (entries[0].isIntersecting) {
+                    quillObserver.disconnect();
+                    Promise.all([
+                        loadStylesheet('https://cdn.quilljs.com/1.3.6/quill.snow.css'),
+                        loadScript('https://cdn.quilljs.com/1.3.6/quill.min.js')
+                    ]).then(initQuill);
+                }
+            }, { rootMargin: '200px' });
+            quillObserver.observe(document.getElementById('longDescription'));
+            
+            // The hidden input is only read on submit, so copy the editor HTML
+            // into it then rather than on every keystroke; if the editor was
+            // never loaded the hidden input still holds the original content
             document.querySelector('form').addEventListener('submit', function() {
-                document.getElementById('longDescriptionInput').value = quill.root.innerHTML;
+                if (quill) {
+                    document.getElementById('longDescriptionInput').value = quill.root.innerHTML;
+                }
             });
             
             // Category/Subcategory handling
-            const subcategoriesData = {
-                {% for category in categories %}
-                {{ category.id }}: [
-                    {% for subcategory in category.subcategories %}
-                    {id: {{ subcategory.id }}, name: "{{ subcategory.name }}"}{{ "," if not loop.last }}
-                    {% endfor %}
-                ]{{ "," if not loop.last }}
-                {% endfor %}
-            };
+            const subcategoriesData = {{ subcategories_json }};
             
             function loadSubcategories() {
                 const categoryId = document.getElementById('categorySelect').value;
@@ -4411,41 +4324,27 @@ def edit_content_page(page_id):
             // Load subcategories on page load
             loadSubcategories();
             
+            // Clone rows from a <template> into one fragment and insert them
+            // with a single append, so adding several rows costs one reflow
+            function appendRows(containerId, template, count, prepareRow) {
+                const rows = document.createDocumentFragment();
+                for (let i = 0; i < count; i++) {
+                    const row = template.content.cloneNode(true);
+                    if (prepareRow) {
+                        prepareRow(row);
+                    }
+                    rows.appendChild(row);
+                }
+                document.getElementById(containerId).appendChild(rows);
+            }
+            
             // Gallery management
             let galleryCounter = {{ page.gallery_images|length }};
             
-            function addGalleryItem() {
-                const container = document.getElementById('gallery-container');
-                const newItem = document.createElement('div');
-                newItem.className = 'gallery-item border rounded p-3 mb-3';
-                newItem.innerHTML = `
-                    <div class="row">
-                        <div class="col-md-3">
-                            <label class="form-label">Image</label>
-                            <input type="file" class="form-control" name="gallery_files[]" accept="image/*" required>
-                        </div>
-                        <div class="col-md-3">
-                            <label class="form-label">Title</label>
-                            <input type="text" class="form-control" name="gallery_title[]">
-                        </div>
-                        <div class="col-md-3">
-                            <label class="form-label">Description</label>
-                            <textarea class="form-control" name="gallery_description[]" rows="2"></textarea>
-                        </div>
-                        <div class="col-md-2">
-                            <label class="form-label">Alt Text</label>
-                            <input type="text" class="form-control" name="gallery_alt_text[]">
-                        </div>
-                        <div class="col-md-1">
-                            <label class="form-label">&nbsp;</label>
-                            <button type="button" class="btn btn-outline-danger d-block" onclick="removeGalleryItem(this)">
-                                <i class="fas fa-trash"></i>
-                            </button>
-                        </div>
-                    </div>
-                `;
-                container.appendChild(newItem);
-                galleryCounter++;
+            const galleryRowTemplate = document.getElementById('galleryRowTemplate');
+            function addGalleryItem(count = 1) {
+                appendRows('gallery-container', galleryRowTemplate, count);
+                galleryCounter += count;
             }
             
             function removeGalleryItem(button) {
@@ -4455,37 +4354,12 @@ def edit_content_page(page_id):
             // Links management
             let linkCounter = {{ page.related_links|length }};
             
-            function addLinkItem() {
-                const container = document.getElementById('links-container');
-                const newItem = document.createElement('div');
-                newItem.className = 'link-item border rounded p-3 mb-3';
-                newItem.innerHTML = `
-                    <div class="row">
-                        <div class="col-md-4">
-                            <label class="form-label">Link Title</label>
-                            <input type="text" class="form-control" name="link_title[]" required>
-                        </div>
-                        <div class="col-md-4">
-                            <label class="form-label">URL</label>
-                            <input type="url" class="form-control" name="link_url[]" required>
-                        </div>
-                        <div class="col-md-2">
-                            <label class="form-label">Open in New Tab</label>
-                            <div class="form-check">
-                                <input type="checkbox" class="form-check-input" name="link_new_tab_${linkCounter}">
-                                <label class="form-check-label">New Tab</label>
-                            </div>
-                        </div>
-                        <div class="col-md-2">
-                            <label class="form-label">&nbsp;</label>
-                            <button type="button" class="btn btn-outline-danger d-block" onclick="removeLinkItem(this)">
-                                <i class="fas fa-trash"></i>
-                            </button>
-                        </div>
-                    </div>
-                `;
-                container.appendChild(newItem);
-                linkCounter++;
+            const linkRowTemplate = document.getElementById('linkRowTemplate');
+            function addLinkItem(count = 1) {
+                appendRows('links-container', linkRowTemplate, count, function(row) {
+                    row.querySelector('input[type=checkbox]').name = 'link_new_tab_' + linkCounter;
+                    linkCounter++;
+                });
             }
             
             function removeLinkItem(button) {
@@ -4495,34 +4369,10 @@ def edit_content_page(page_id):
             // Downloads management
             let downloadCounter = {{ page.downloads|length }};
             
-            function addDownloadItem() {
-                const container = document.getElementById('downloads-container');
-                const newItem = document.createElement('div');
-                newItem.className = 'download-item border rounded p-3 mb-3';
-                newItem.innerHTML = `
-                    <div class="row">
-                        <div class="col-md-3">
-                            <label class="form-label">File</label>
-                            <input type="file" class="form-control" name="download_files[]" required>
-                        </div>
-                        <div class="col-md-3">
-                            <label class="form-label">Title</label>
-                            <input type="text" class="form-control" name="download_title[]" required>
-                        </div>
-                        <div class="col-md-4">
-                            <label class="form-label">Description</label>
-                            <textarea class="form-control" name="download_description[]" rows="2"></textarea>
-                        </div>
-                        <div class="col-md-1">
-                            <label class="form-label">&nbsp;</label>
-                            <button type="button" class="btn btn-outline-danger d-block" onclick="removeDownloadItem(this)">
-                                <i class="fas fa-trash"></i>
-                            </button>
-                        </div>
-                    </div>
-                `;
-                container.appendChild(newItem);
-                downloadCounter++;
+            const downloadRowTemplate = document.getElementById('downloadRowTemplate');
+            function addDownloadItem(count = 1) {
+                appendRows('downloads-container', downloadRowTemplate, count);
+                downloadCounter += count;
             }
             
             function removeDownloadItem(button) {
@@ -4531,7 +4381,16 @@ def edit_content_page(page_id):
         </script>
     </body>
     </html>
-    ''', page=page, categories=categories)
+    ''', page=page, categories=categories, subcategories_json=get_subcategories_json(), sidebar_html=get_sidebar_html('content'))
+
+@app.route('/upload/inline-image', methods=['POST'])
+@login_required
+def upload_inline_image():
+    """Save an image inserted from the page editor toolbar and return its URL"""
+    filename = save_uploaded_file(request.files.get('file'), 'content/images', 'image')
+    if not filename:
+        return jsonify({'error': 'Please upload a valid image file'}), 400
+    return jsonify({'url': f"/uploads/content/images/{filename}"})
 
 @app.route('/content/view/<int:page_id>')
 @login_required
@@ -5240,13 +5099,12 @@ def add_event():
         
         # Handle multiple category assignments
         selected_categories = request.form.getlist('categories')
-        for category_id in selected_categories:
-            if category_id:
-                assignment = EventCategoryAssignment(
-                    event_id=event.id,
-                    category_id=int(category_id)
-                )
-                db.session.add(assignment)
+        assignment_rows = [
+            {'event_id': event.id, 'category_id': int(category_id)}
+            for category_id in selected_categories if category_id
+        ]
+        if assignment_rows:
+            db.session.bulk_insert_mappings(EventCategoryAssignment, assignment_rows)
         
         # Handle gallery images
         gallery_files = request.files.getlist('gallery_images')
@@ -5254,52 +5112,58 @@ def add_event():
         gallery_descriptions = request.form.getlist('gallery_descriptions')
         gallery_alt_texts = request.form.getlist('gallery_alt_texts')
         
+        gallery_rows = []
         for i, file in enumerate(gallery_files):
             if file and file.filename and allowed_file(file.filename):
                 filename = save_uploaded_file(file, 'events/gallery')
-                gallery_image = EventGallery(
-                    event_id=event.id,
-                    filename=filename,
-                    title=gallery_titles[i] if i < len(gallery_titles) else '',
-                    description=gallery_descriptions[i] if i < len(gallery_descriptions) else '',
-                    alt_text=gallery_alt_texts[i] if i < len(gallery_alt_texts) else '',
-                    sort_order=i
-                )
-                db.session.add(gallery_image)
+                gallery_rows.append({
+                    'event_id': event.id,
+                    'filename': filename,
+                    'title': gallery_titles[i] if i < len(gallery_titles) else '',
+                    'description': gallery_descriptions[i] if i < len(gallery_descriptions) else '',
+                    'alt_text': gallery_alt_texts[i] if i < len(gallery_alt_texts) else '',
+                    'sort_order': i
+                })
+        if gallery_rows:
+            db.session.bulk_insert_mappings(EventGallery, gallery_rows)
         
         # Handle related links
         link_titles = request.form.getlist('link_titles')
         link_urls = request.form.getlist('link_urls')
         link_new_tabs = request.form.getlist('link_new_tabs')
         
+        link_rows = []
         for i, title in enumerate(link_titles):
             if title.strip() and i < len(link_urls) and link_urls[i].strip():
-                link = EventLink(
-                    event_id=event.id,
-                    title=title.strip(),
-                    url=link_urls[i].strip(),
-                    new_tab=str(i) in link_new_tabs,  # Checkbox values come as indices
-                    sort_order=i
-                )
-                db.session.add(link)
+                link_rows.append({
+                    'event_id': event.id,
+                    'title': title.strip(),
+                    'url': link_urls[i].strip(),
+                    'new_tab': str(i) in link_new_tabs,  # Checkbox values come as indices
+                    'sort_order': i
+                })
+        if link_rows:
+            db.session.bulk_insert_mappings(EventLink, link_rows)
         
         # Handle downloads
         download_files = request.files.getlist('download_files')
         download_titles = request.form.getlist('download_titles')
         download_descriptions = request.form.getlist('download_descriptions')
         
+        download_rows = []
         for i, file in enumerate(download_files):
             if file and file.filename:
                 filename = save_uploaded_file(file, 'events/downloads', 'download')
                 if filename:
-                    download_item = EventDownload(
-                        event_id=event.id,
-                        filename=filename,
-                        title=download_titles[i] if i < len(download_titles) else file.filename,
-                        description=download_descriptions[i] if i < len(download_descriptions) else '',
-                        sort_order=i
-                    )
-                    db.session.add(download_item)
+                    download_rows.append({
+                        'event_id': event.id,
+                        'filename': filename,
+                        'title': download_titles[i] if i < len(download_titles) else file.filename,
+                        'description': download_descriptions[i] if i < len(download_descriptions) else '',
+                        'sort_order': i
+                    })
+        if download_rows:
+            db.session.bulk_insert_mappings(EventDownload, download_rows)
         
         db.session.commit()
         flash('Event created successfully!', 'success')
@@ -5808,10 +5672,14 @@ def event_categories():
     </html>
     ''', categories=categories)
 
-# File upload route
+# File upload route - only used when nothing sits in front of the app; in
+# production the web server should serve /uploads/ directly (see README)
 @app.route('/uploads/<path:filename>')
 def uploaded_file(filename):
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    response = send_from_directory(app.config['UPLOAD_FOLDER'], filename, max_age=UPLOAD_CACHE_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 # Event Management Routes
 @app.route('/events/view/<int:event_id>')
@@ -5919,13 +5787,12 @@ def edit_event(event_id):
         EventCategoryAssignment.query.filter_by(event_id=event.id).delete()
         
         selected_categories = request.form.getlist('categories')
-        for category_id in selected_categories:
-            if category_id:
-                assignment = EventCategoryAssignment(
-                    event_id=event.id,
-                    category_id=int(category_id)
-                )
-                db.session.add(assignment)
+        assignment_rows = [
+            {'event_id': event.id, 'category_id': int(category_id)}
+            for category_id in selected_categories if category_id
+        ]
+        if assignment_rows:
+            db.session.bulk_insert_mappings(EventCategoryAssignment, assignment_rows)
         
         # Handle related links
         link_titles = request.form.getlist('link_titles')
@@ -5937,16 +5804,18 @@ def edit_event(event_id):
             # Clear existing links only if new ones are provided
             EventLink.query.filter_by(event_id=event.id).delete()
         
+        link_rows = []
         for i, title in enumerate(link_titles):
             if title.strip() and i < len(link_urls) and link_urls[i].strip():
-                link = EventLink(
-                    event_id=event.id,
-                    title=title.strip(),
-                    url=link_urls[i].strip(),
-                    new_tab=str(i) in link_new_tabs,
-                    sort_order=i
-                )
-                db.session.add(link)
+                link_rows.append({
+                    'event_id': event.id,
+                    'title': title.strip(),
+                    'url': link_urls[i].strip(),
+                    'new_tab': str(i) in link_new_tabs,
+                    'sort_order': i
+                })
+        if link_rows:
+            db.session.bulk_insert_mappings(EventLink, link_rows)
         
         # Handle downloads
         download_files = request.files.getlist('download_files')
@@ -5958,18 +5827,20 @@ def edit_event(event_id):
             # Clear existing downloads only if new ones are provided
             EventDownload.query.filter_by(event_id=event.id).delete()
         
+        download_rows = []
         for i, file in enumerate(download_files):
             if file and file.filename:
                 filename = save_uploaded_file(file, 'events/downloads', 'download')
                 if filename:
-                    download_item = EventDownload(
-                        event_id=event.id,
-                        filename=filename,
-                        title=download_titles[i] if i < len(download_titles) else file.filename,
-                        description=download_descriptions[i] if i < len(download_descriptions) else '',
-                        sort_order=i
-                    )
-                    db.session.add(download_item)
+                    download_rows.append({
+                        'event_id': event.id,
+                        'filename': filename,
+                        'title': download_titles[i] if i < len(download_titles) else file.filename,
+                        'description': download_descriptions[i] if i < len(download_descriptions) else '',
+                        'sort_order': i
+                    })
+        if download_rows:
+            db.session.bulk_insert_mappings(EventDownload, download_rows)
         
         db.session.commit()
         flash('Event updated successfully!', 'success')
@@ -7617,13 +7488,8 @@ def get_councillors():
             except Exception as e:
                 print(f"🔍 DEBUG: Error fetching tags for councillor {councillor.id}: {e}")
             
-            # Parse social links
-            social_links = {}
-            try:
-                if councillor.social_links:
-                    social_links = json.loads(councillor.social_links)
-            except Exception as e:
-                print(f"🔍 DEBUG: Error parsing social links for {councillor.name}: {e}")
+            # Social links are decoded by the column type
+            social_links = councillor.social_links or {}
             
             # Build complete councillor data
             councillor_data = {
@@ -7713,13 +7579,8 @@ def get_councillor_details(councillor_id):
         except Exception as e:
             print(f"❌ ERROR: Failed to fetch tags: {e}")
         
-        # Parse social links
-        social_links = {}
-        try:
-            if councillor.social_links:
-                social_links = json.loads(councillor.social_links)
-        except Exception as e:
-            print(f"❌ ERROR: Failed to parse social links: {e}")
+        # Social links are decoded by the column type
+        social_links = councillor.social_links or {}
         
         # Build the complete councillor data
         councillor_data = {
@@ -7788,9 +7649,9 @@ def get_councillors_by_tag(tag_name):
         # Get councillors with this tag
         try:
             councillors_query = Councillor.query.join(
-                CouncillorTag, Councillor.id == CouncillorTag.councillor_id
+                councillor_tag, Councillor.id == councillor_tag.c.councillor_id
             ).filter(
-                CouncillorTag.tag_id == tag.id,
+                councillor_tag.c.tag_id == tag.id,
                 Councillor.is_published == True
             ).order_by(Councillor.name.asc())
             
@@ -7813,24 +7674,19 @@ def get_councillors_by_tag(tag_name):
             # Get all tags for this councillor
             tags = []
             try:
-                for councillor_tag in councillor.tags:
+                for assigned_tag in councillor.tags:
                     tag_data = {
-                        'id': councillor_tag.id,
-                        'name': councillor_tag.name,
-                        'color': councillor_tag.color
+                        'id': assigned_tag.id,
+                        'name': assigned_tag.name,
+                        'color': assigned_tag.color
                     }
                     tags.append(tag_data)
                     
             except Exception as e:
                 print(f"🔍 DEBUG: Error fetching tags for councillor {councillor.id}: {e}")
             
-            # Parse social links
-            social_links = {}
-            try:
-                if councillor.social_links:
-                    social_links = json.loads(councillor.social_links)
-            except Exception as e:
-                print(f"🔍 DEBUG: Error parsing social links for {councillor.name}: {e}")
+            # Social links are decoded by the column type
+            social_links = councillor.social_links or {}
             
             # Build councillor data
             councillor_data = {
@@ -7901,9 +7757,9 @@ def get_councillor_tags():
         # Get all tags that are used by published councillors
         try:
             tags_query = Tag.query.join(
-                CouncillorTag, Tag.id == CouncillorTag.tag_id
+                councillor_tag, Tag.id == councillor_tag.c.tag_id
             ).join(
-                Councillor, CouncillorTag.councillor_id == Councillor.id
+                Councillor, councillor_tag.c.councillor_id == Councillor.id
             ).filter(
                 Councillor.is_published == True
             ).distinct().order_by(Tag.name.asc())
@@ -7919,9 +7775,9 @@ def get_councillor_tags():
         for tag in tags_list:
             # Count councillors with this tag
             councillor_count = Councillor.query.join(
-                CouncillorTag, Councillor.id == CouncillorTag.councillor_id
+                councillor_tag, Councillor.id == councillor_tag.c.councillor_id
             ).filter(
-                CouncillorTag.tag_id == tag.id,
+                councillor_tag.c.tag_id == tag.id,
                 Councillor.is_published == True
             ).count()
             
@@ -8673,6 +8529,9 @@ if __name__ == '__main__':
     with app.app_context():
         db.create_all()
         
+        # Create the initial admin account
+        init_admin_user()
+        
         # Create sample data if none exists
         if Tag.query.count() == 0:
             sample_tags = [
@@ -8775,8 +8634,7 @@ if __name__ == '__main__':
                 councillor = councillors[councillor_idx]
                 for tag_idx in tag_indices:
                     if tag_idx < len(tags):
-                        councillor_tag = CouncillorTag(councillor_id=councillor.id, tag_id=tags[tag_idx].id)
-                        db.session.add(councillor_tag)
+                        councillor.tags.append(tags[tag_idx])
             
             db.session.commit()
     
@@ -9170,8 +9028,7 @@ if __name__ == '__main__':
                 councillor = councillors[councillor_idx]
                 for tag_idx in tag_indices:
                     if tag_idx < len(tags):
-                        councillor_tag = CouncillorTag(councillor_id=councillor.id, tag_id=tags[tag_idx].id)
-                        db.session.add(councillor_tag)
+                        councillor.tags.append(tags[tag_idx])
             
             db.session.commit()
         
@@ -9853,6 +9710,10 @@ def add_meeting():
             frequency = request.form.get('frequency')  # weekly, fortnightly, 4-weekly, monthly
             count = int(request.form.get('future_count', 1))
             
+            # Only monthly schedules need dateutil, so import it on first use
+            if frequency == 'monthly':
+                from dateutil.relativedelta import relativedelta
+            
             base_date = meeting.meeting_date
             for i in range(1, count + 1):
                 if frequency == 'weekly':
@@ -10898,8 +10759,8 @@ def content_review_system():
         <title>Content Review System - Kesgrave CMS</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
         <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+        <link href="{{ admin_css_url }}" rel="stylesheet">
         <style>
-            {{ sidebar_css|safe }}
             .summary-card {
                 background: white;
                 border-radius: 10px;
@@ -11218,8 +11079,7 @@ def content_review_system():
     total_count=len(all_content_pages),
     today=today,
     get_days_until_review=get_days_until_review,
-    sidebar_html=get_sidebar_html('content-review'),
-    sidebar_css=get_sidebar_css()
+    sidebar_html=get_sidebar_html('content-review')
     )
 
 # ===== CONTENT API ENDPOINTS =====
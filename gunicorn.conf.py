@@ -0,0 +1,33 @@
+# Gunicorn configuration for running the CMS in production
+#
+# Usage:
+#     gunicorn -c gunicorn.conf.py cms_final_complete-old:app
+#
+# The CMS spends most of each request waiting on SQLite, file uploads and
+# template rendering, so each worker process runs a pool of threads. Real
+# threads (rather than gevent greenlets) also let the upload thread pool
+# resize images in parallel.
+#
+# The app cache is a FileSystemCache in instance/cache, so every worker on
+# this host sees the same cached data and the same invalidations. Running
+# workers on several hosts needs a shared cache backend (e.g. Redis) instead.
+
+import importlib
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8027')
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Uploads are capped at 16MB (MAX_CONTENT_LENGTH), allow time for slow links
+timeout = 120
+
+def on_starting(server):
+    """Create any missing tables and the first admin account before the workers start"""
+    cms = importlib.import_module('cms_final_complete-old')
+    with cms.app.app_context():
+        cms.db.create_all()
+        cms.init_admin_user()
+        # The workers open their own connections, don't hand them the master's
+        cms.db.engine.dispose()
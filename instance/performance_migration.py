@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Performance Indexes Database Migration Script
+=============================================
+
+This script adds the indexes used by the CMS's filtered and ordered queries
+to an existing Kesgrave CMS database. New databases get them automatically
+from db.create_all(); existing tables need this script because create_all()
+never alters a table that is already there.
+
+Usage:
+    python performance_migration.py
+
+Requirements:
+    - Your existing CMS database file (kesgrave_working.db)
+"""
+
+import sqlite3
+import os
+
+# (index name, table, columns) - names match the ones SQLAlchemy generates
+INDEXES = [
+    ('ix_councillor_updated_at', 'councillor', 'updated_at'),
+    ('ix_councillor_pub_updated', 'councillor', 'is_published, updated_at'),
+    ('ix_tag_active_name', 'tag', 'is_active, name'),
+    # Older databases keep a surrogate id key on councillor_tag, so both
+    # foreign keys need an index of their own there
+    ('ix_councillor_tag_councillor_id', 'councillor_tag', 'councillor_id'),
+    ('ix_councillor_tag_tag_id', 'councillor_tag', 'tag_id'),
+    ('ix_content_page_status', 'content_page', 'status'),
+    ('ix_content_page_category_id', 'content_page', 'category_id'),
+    ('ix_content_page_created_id', 'content_page', 'created_at, id'),
+    ('ix_event_start_date', 'event', 'start_date'),
+    ('ix_event_status', 'event', 'status'),
+    ('ix_meeting_meeting_date', 'meeting', 'meeting_date'),
+]
+
+# Data fixes the indexed queries rely on. The content list pages through
+# (created_at, id), so a page with no created_at would never be listed
+BACKFILLS = [
+    ('content_page.created_at',
+     'UPDATE content_page SET created_at = COALESCE(creation_date, updated_at, CURRENT_TIMESTAMP) '
+     'WHERE created_at IS NULL'),
+]
+
+# Single-column indexes made redundant by a composite index that starts with
+# the same column - dropped so writes stop maintaining them
+OBSOLETE_INDEXES = ['ix_councillor_is_published', 'ix_tag_is_active']
+
+def create_performance_indexes():
+    """Create the performance indexes in the existing database"""
+    
+    # Database file path (adjust if your database is in a different location)
+    db_path = 'kesgrave_working.db'
+    
+    if not os.path.exists(db_path):
+        print(f"❌ Database file '{db_path}' not found!")
+        print("Please make sure you're running this script from the same directory as your CMS database.")
+        return False
+    
+    try:
+        # Connect to the database
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        
+        print("🔄 Starting performance indexes migration...")
+        
+        for column, statement in BACKFILLS:
+            cursor.execute(statement)
+            print(f"✅ Backfilled {cursor.rowcount} missing {column} value(s)")
+        
+        for index_name, table, columns in INDEXES:
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})')
+            print(f"✅ Created index {index_name} on {table} ({columns})")
+        
+        for index_name in OBSOLETE_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+            print(f"✅ Dropped redundant index {index_name}")
+        
+        # Refresh the query planner statistics so the new indexes get used
+        cursor.execute('ANALYZE')
+        
+        # Commit all changes
+        conn.commit()
+        
+        # Close connection
+        conn.close()
+        
+        print("\n🎉 Performance indexes migration completed successfully!")
+        return True
+        
+    except sqlite3.Error as e:
+        print(f"❌ Database error: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("⚡ PERFORMANCE INDEXES DATABASE MIGRATION")
+    print("=" * 60)
+    print()
+    
+    if create_performance_indexes():
+        print("\nNext steps:")
+        print("1. Restart your CMS application")
+        print()
+    else:
+        print("\n❌ Migration failed during database update")
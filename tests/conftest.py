@@ -0,0 +1,73 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_cms():
+    """Execute the admin CMS module afresh, as a new worker process would"""
+    spec = importlib.util.spec_from_file_location('cms_admin', os.path.join(ROOT, 'cms_final_complete-old.py'))
+    module = importlib.util.module_from_spec(spec)
+    # Flask finds the app's root (static files, instance folder) through sys.modules
+    previous = sys.modules.get('cms_admin')
+    sys.modules['cms_admin'] = module
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        if previous is not None:
+            sys.modules['cms_admin'] = previous
+    module.app.config['TESTING'] = True
+    return module
+
+
+@pytest.fixture(scope='session')
+def cms(tmp_path_factory):
+    """The admin CMS module, loaded against a throwaway database and upload folder"""
+    workdir = tmp_path_factory.mktemp('cms')
+    os.environ['CMS_DATABASE_URI'] = f"sqlite:///{workdir / 'test.db'}"
+    os.environ['CMS_CACHE_DIR'] = str(workdir / 'cache')
+    os.chdir(workdir)
+    module = load_cms()
+    with module.app.app_context():
+        module.db.create_all()
+    return module
+
+
+@pytest.fixture(scope='session')
+def other_worker(cms):
+    """A second copy of the app on the same database and cache, standing in for another worker process"""
+    return load_cms()
+
+
+@pytest.fixture
+def db(cms):
+    """Empty every table after each test"""
+    yield cms.db
+    with cms.app.app_context():
+        for table in reversed(cms.db.metadata.sorted_tables):
+            cms.db.session.execute(table.delete())
+        cms.db.session.commit()
+    cms.cache.clear()
+
+
+@pytest.fixture
+def client(cms, db):
+    """A test client logged in as the admin user"""
+    cms.init_admin_user()
+    return login(cms)
+
+
+@pytest.fixture
+def other_client(cms, other_worker, client):
+    """A logged in test client for the other worker"""
+    return login(other_worker)
+
+
+def login(module):
+    """A test client for the given app copy, logged in as the admin user"""
+    client = module.app.test_client()
+    client.post('/login', data={'username': 'admin', 'password': 'admin'})
+    return client
@@ -0,0 +1,27 @@
+def test_login_accepts_the_admin_password(cms, db):
+    cms.init_admin_user()
+    client = cms.app.test_client()
+
+    response = client.post('/login', data={'username': 'admin', 'password': 'admin'})
+
+    assert response.status_code == 302
+    assert client.get('/dashboard').status_code == 200
+
+
+def test_login_rejects_a_wrong_password(cms, db):
+    cms.init_admin_user()
+    client = cms.app.test_client()
+
+    response = client.post('/login', data={'username': 'admin', 'password': 'wrong'})
+
+    assert response.status_code == 200
+    assert 'Invalid username or password' in response.get_data(as_text=True)
+    assert client.get('/dashboard').status_code == 302
+
+
+def test_passwords_are_stored_hashed(cms, db):
+    cms.init_admin_user()
+    with cms.app.app_context():
+        admin = cms.AdminUser.query.filter_by(username='admin').one()
+        assert admin.password_hash != 'admin'
+        assert admin.check_password('admin')
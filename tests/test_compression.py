@@ -0,0 +1,43 @@
+import gzip
+
+
+GZIP = {'Accept-Encoding': 'gzip'}
+
+
+def test_gzipped_page_gets_its_own_etag(client):
+    plain = client.get('/content/pages')
+    gzipped = client.get('/content/pages', headers=GZIP)
+
+    assert 'Content-Encoding' not in plain.headers
+    assert gzipped.headers['Content-Encoding'] == 'gzip'
+    assert gzipped.headers['ETag'] == plain.headers['ETag'][:-1] + '-gzip"'
+    assert 'Accept-Encoding' in plain.headers['Vary']
+    assert 'Accept-Encoding' in gzipped.headers['Vary']
+
+
+def test_gzipped_etag_revalidates(client):
+    etag = client.get('/content/pages', headers=GZIP).headers['ETag']
+
+    response = client.get('/content/pages', headers={**GZIP, 'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_gzipped_councillor_list_revalidates(client):
+    etag = client.get('/councillors', headers=GZIP).headers['ETag']
+
+    assert client.get('/councillors', headers={**GZIP, 'If-None-Match': etag}).status_code == 304
+
+
+def test_councillor_list_is_gzipped(cms, client):
+    with cms.app.app_context():
+        cms.db.session.add_all(cms.Councillor(name=f'Councillor {i}', title='Cllr') for i in range(3))
+        cms.db.session.commit()
+
+    response = client.get('/councillors', headers=GZIP)
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['ETag'].endswith('-gzip"')
+    assert b'Councillor 2' in gzip.decompress(response.data)
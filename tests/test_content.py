@@ -0,0 +1,154 @@
+import re
+from html import unescape
+
+
+def add_category(cms, name, subcategories=()):
+    with cms.app.app_context():
+        category = cms.ContentCategory(name=name, url_path=name.lower(), is_active=True)
+        cms.db.session.add(category)
+        for subcategory in subcategories:
+            cms.db.session.add(cms.ContentSubcategory(name=subcategory, category=category))
+        cms.db.session.commit()
+        return category.id
+
+
+def test_pages_filter_shows_category_renamed_by_another_worker(cms, client, other_client):
+    category_id = add_category(cms, 'Planning')
+    assert b'Planning' in client.get('/content/pages').data
+
+    other_client.post(f'/content/categories/edit/{category_id}', data={'name': 'Planning Notices', 'url_path': 'planning'})
+
+    assert b'Planning Notices' in client.get('/content/pages').data
+
+
+def test_page_form_lists_subcategories_added_by_another_worker(cms, client, other_client):
+    add_category(cms, 'Planning', ['Applications'])
+    assert b'Decisions' not in client.get('/content/add').data
+
+    other_client.post('/content/categories/add', data={
+        'name': 'Council', 'url_path': 'council', 'subcategory_name[]': ['Decisions'], 'subcategory_path[]': ['']
+    })
+
+    page = client.get('/content/add').data
+    assert b'Council' in page
+    assert b'Decisions' in page
+
+
+def test_pages_etag_changes_when_another_worker_renames_a_category(cms, client, other_client):
+    category_id = add_category(cms, 'Planning')
+    etag = client.get('/content/pages').headers['ETag']
+    assert client.get('/content/pages', headers={'If-None-Match': etag}).status_code == 304
+
+    other_client.post(f'/content/categories/edit/{category_id}', data={'name': 'Planning Notices', 'url_path': 'planning'})
+
+    response = client.get('/content/pages', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_categories_etag_changes_when_only_the_description_is_edited(cms, client, other_client):
+    category_id = add_category(cms, 'Planning')
+    etag = client.get('/content/categories').headers['ETag']
+    assert client.get('/content/categories', headers={'If-None-Match': etag}).status_code == 304
+
+    other_client.post(f'/content/categories/edit/{category_id}', data={
+        'name': 'Planning', 'description': 'Applications and decisions', 'url_path': 'planning-notices'
+    })
+
+    response = client.get('/content/categories', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert b'Applications and decisions' in response.data
+
+def test_pages_with_the_same_title_get_unique_slugs(cms, client):
+    category_id = add_category(cms, 'Planning')
+
+    for _ in range(3):
+        response = client.post('/content/add', data={'title': 'Annual Report', 'category_id': category_id})
+        assert response.status_code == 302
+
+    with cms.app.app_context():
+        slugs = [page.slug for page in cms.ContentPage.query.order_by(cms.ContentPage.id)]
+    assert slugs[0] == 'annual-report'
+    assert len(set(slugs)) == 3
+    assert all(slug.startswith('annual-report') for slug in slugs)
+
+
+def add_pages(cms, count, created_at=None, status='Published'):
+    """Add numbered pages, each a minute newer than the last unless created_at fixes them all to one time"""
+    start = cms.datetime(2025, 1, 1)
+    with cms.app.app_context():
+        pages = [
+            cms.ContentPage(
+                title=f'{status} page {i}', slug=f'{status.lower()}-page-{i}', status=status,
+                created_at=created_at or start + cms.timedelta(minutes=i)
+            )
+            for i in range(count)
+        ]
+        cms.db.session.add_all(pages)
+        cms.db.session.commit()
+        return [page.id for page in pages]
+
+
+def listed_page(client, url):
+    """(page ids in list order, Previous link, Next link) for one content list page"""
+    html = client.get(url).get_data(as_text=True)
+    ids = [int(page_id) for page_id in re.findall(r'href="/content/edit/(\d+)" class="btn btn-outline-primary"', html)]
+    links = {label: unescape(href) for href, label in re.findall(r'class="page-link" href="([^"]+)">(Previous|Next)</a>', html)}
+    return ids, links.get('Previous'), links.get('Next')
+
+
+def walk_next(client, url):
+    """Follow the Next links from url to the last page, returning every page's ids"""
+    pages = []
+    while url:
+        ids, _, url = listed_page(client, url)
+        pages.append(ids)
+    return pages
+
+
+def test_pages_list_walks_forward_and_back(cms, client):
+    page_ids = add_pages(cms, 45)
+    newest_first = page_ids[::-1]
+
+    first, previous, next_url = listed_page(client, '/content/pages')
+    assert first == newest_first[:20]
+    assert previous is None
+    second, previous, next_url = listed_page(client, next_url)
+    assert second == newest_first[20:40]
+    third, previous, next_url = listed_page(client, next_url)
+    assert third == newest_first[40:]
+    assert next_url is None
+
+    back, previous, _ = listed_page(client, previous)
+    assert back == second
+    back, previous, _ = listed_page(client, previous)
+    assert back == first
+    assert previous is None
+
+
+def test_pages_list_pages_through_identical_created_at(cms, client):
+    page_ids = add_pages(cms, 45, created_at=cms.datetime(2025, 1, 1))
+
+    pages = walk_next(client, '/content/pages')
+
+    assert [len(ids) for ids in pages] == [20, 20, 5]
+    assert sum(pages, []) == sorted(page_ids, reverse=True)
+
+
+def test_pages_list_keeps_filters_in_cursor_links(cms, client):
+    published_ids = add_pages(cms, 25, status='Published')
+    add_pages(cms, 25, status='Draft')
+
+    _, _, next_url = listed_page(client, '/content/pages?status=Published')
+    assert 'status=Published' in next_url
+    pages = walk_next(client, '/content/pages?status=Published')
+
+    assert sum(pages, []) == published_ids[::-1]
+
+
+def test_page_forms_defer_the_bootstrap_bundle(cms, client):
+    page_ids = add_pages(cms, 1)
+
+    for url in ('/content/add', f'/content/edit/{page_ids[0]}'):
+        html = client.get(url).get_data(as_text=True)
+        assert '<script defer src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js">' in html
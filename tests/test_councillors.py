@@ -0,0 +1,80 @@
+import re
+
+
+def test_councillors_by_tag_lists_tagged_councillors(cms, client):
+    with cms.app.app_context():
+        ward = cms.Tag(name='East Ward', color='#3498db')
+        other = cms.Tag(name='West Ward', color='#e74c3c')
+        tagged = cms.Councillor(name='Alice', title='Cllr', is_published=True, tags=[ward, other])
+        untagged = cms.Councillor(name='Bob', title='Cllr', is_published=True)
+        cms.db.session.add_all([tagged, untagged])
+        cms.db.session.commit()
+
+    response = client.get('/api/councillors/tag/East Ward')
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['tag']['name'] == 'East Ward'
+    assert [councillor['name'] for councillor in data['councillors']] == ['Alice']
+    assert {tag['name'] for tag in data['councillors'][0]['tags']} == {'East Ward', 'West Ward'}
+
+
+def test_delete_tagged_councillor(cms, client):
+    with cms.app.app_context():
+        councillor = cms.Councillor(name='Alice', title='Cllr', tags=[cms.Tag(name='East Ward')])
+        cms.db.session.add(councillor)
+        cms.db.session.commit()
+        councillor_id = councillor.id
+
+    response = client.post(f'/councillors/delete/{councillor_id}')
+
+    assert response.status_code == 302
+    with cms.app.app_context():
+        assert cms.db.session.get(cms.Councillor, councillor_id) is None
+        assert cms.db.session.execute(cms.councillor_tag.select()).all() == []
+
+
+def test_councillor_list_shows_tag_renamed_by_another_worker(cms, client, other_client):
+    with cms.app.app_context():
+        tag = cms.Tag(name='East Ward')
+        cms.db.session.add(cms.Councillor(name='Alice', title='Cllr', tags=[tag]))
+        cms.db.session.commit()
+        tag_id = tag.id
+    assert b'East Ward' in client.get('/councillors').data
+
+    other_client.post(f'/tags/edit/{tag_id}', data={'name': 'Kesgrave East', 'color': '#3498db', 'is_active': 'on'})
+
+    page = client.get('/councillors').data
+    assert b'Kesgrave East' in page
+    assert b'East Ward' not in page
+
+
+def test_edit_form_checks_the_councillors_tags(cms, client):
+    with cms.app.app_context():
+        ward = cms.Tag(name='East Ward')
+        other = cms.Tag(name='West Ward')
+        councillor = cms.Councillor(name='Alice', title='Cllr', tags=[ward])
+        cms.db.session.add_all([councillor, other])
+        cms.db.session.commit()
+        councillor_id, ward_id, other_id = councillor.id, ward.id, other.id
+
+    page = client.get(f'/councillors/edit/{councillor_id}').get_data(as_text=True)
+
+    checked = re.findall(r'value="(\d+)" id="tag\d+"\s*(checked)?>', page)
+    assert dict(checked) == {str(ward_id): 'checked', str(other_id): ''}
+
+
+def test_edit_replaces_the_councillors_tags(cms, client):
+    with cms.app.app_context():
+        ward = cms.Tag(name='East Ward')
+        other = cms.Tag(name='West Ward')
+        councillor = cms.Councillor(name='Alice', title='Cllr', tags=[ward])
+        cms.db.session.add_all([councillor, other])
+        cms.db.session.commit()
+        councillor_id, other_id = councillor.id, other.id
+
+    response = client.post(f'/councillors/edit/{councillor_id}', data={'name': 'Alice', 'title': 'Cllr', 'tags': [other_id]})
+
+    assert response.status_code == 302
+    with cms.app.app_context():
+        assert [tag.name for tag in cms.db.session.get(cms.Councillor, councillor_id).tags] == ['West Ward']
@@ -0,0 +1,28 @@
+def test_tags_page_shows_tag_added_by_another_worker(client, other_client):
+    assert b'East Ward' not in client.get('/tags').data
+
+    response = other_client.post('/tags/add', data={'name': 'East Ward', 'color': '#3498db', 'is_active': 'on'})
+
+    assert response.status_code == 302
+    assert b'East Ward' in client.get('/tags').data
+
+
+def test_councillor_form_lists_tag_added_by_another_worker(client, other_client):
+    assert b'East Ward' not in client.get('/councillors/add').data
+
+    other_client.post('/tags/add', data={'name': 'East Ward', 'color': '#3498db', 'is_active': 'on'})
+
+    assert b'East Ward' in client.get('/councillors/add').data
+
+
+def test_councillor_form_drops_tag_deactivated_by_another_worker(cms, client, other_client):
+    with cms.app.app_context():
+        tag = cms.Tag(name='East Ward', is_active=True)
+        cms.db.session.add(tag)
+        cms.db.session.commit()
+        tag_id = tag.id
+    assert b'East Ward' in client.get('/councillors/add').data
+
+    other_client.post(f'/tags/edit/{tag_id}', data={'name': 'East Ward', 'color': '#3498db'})
+
+    assert b'East Ward' not in client.get('/councillors/add').data